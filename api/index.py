@@ -3,14 +3,31 @@
 import sys
 import os
 import json
-from http.server import BaseHTTPRequestHandler
-import asyncio
-from typing import Dict, Any
+import functools
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable
 import traceback
-
-# Import required modules for serverless environment
-import uuid
-import hashlib
+import zlib
+import socket
+import threading
+
+# orjson is ~4-5x faster than the stdlib encoder and parses bytes directly;
+# fall back to the standard library so the server still runs without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Reused stdlib encoders for the fallback path: json.dumps builds a fresh
+# encoder on every call that passes options. Serialized data is always a tree,
+# so the circular-reference check is skipped. Output stays ASCII-escaped: json
+# accepts lone surrogate escapes such as "\ud800", which cannot be encoded as UTF-8.
+JSON_ENCODE = json.JSONEncoder(separators=(',', ':'), check_circular=False).encode
+CANONICAL_JSON_ENCODE = json.JSONEncoder(
+    sort_keys=True, separators=(',', ':'), check_circular=False
+).encode
 
 # Enhanced error codes following MCP standards
 ERROR_CODES = {
@@ -31,6 +48,127 @@ PAYLOAD_LIMITS = {
     'MAX_STRING_LENGTH': 500_000     # Maximum string length (500KB - detailed descriptions)
 }
 
+# Limits and error codes bound to module names for the per-request hot path
+MAX_PAYLOAD_SIZE = PAYLOAD_LIMITS['MAX_PAYLOAD_SIZE']
+MAX_JSON_DEPTH = PAYLOAD_LIMITS['MAX_JSON_DEPTH']
+MAX_OBJECT_KEYS = PAYLOAD_LIMITS['MAX_OBJECT_KEYS']
+MAX_ARRAY_LENGTH = PAYLOAD_LIMITS['MAX_ARRAY_LENGTH']
+MAX_STRING_LENGTH = PAYLOAD_LIMITS['MAX_STRING_LENGTH']
+PAYLOAD_TOO_LARGE_CODE = ERROR_CODES['PAYLOAD_TOO_LARGE']
+PAYLOAD_TOO_COMPLEX_CODE = ERROR_CODES['PAYLOAD_TOO_COMPLEX']
+INVALID_PARAMETER_CODE = ERROR_CODES['INVALID_PARAMETER']
+TOOL_EXECUTION_FAILED_CODE = ERROR_CODES['TOOL_EXECUTION_FAILED']
+INTERNAL_ERROR_CODE = ERROR_CODES['INTERNAL_ERROR']
+
+def json_dumps(data: object) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes, using orjson when available.
+
+    Keys are emitted in insertion order; responses are never key-sorted, since
+    sorting every nested framework dict costs time and clients do not rely on order.
+    Integers beyond 64 bits, which orjson refuses, are encoded by the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass
+    return JSON_ENCODE(data).encode('utf-8')
+
+# orjson silently parses integers beyond the 64-bit range as floats. Such an
+# integer needs at least 19 digits in a row, so input holding a 19-digit run
+# (found by mapping every digit to '0') is parsed by the stdlib instead
+DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+LONG_DIGIT_RUN = b'0' * 19
+
+def json_loads(data: bytes | bytearray) -> object:
+    """Parse JSON from raw request bytes, using orjson when available.
+
+    Input orjson would reject or alter but the stdlib accepts (lone surrogate
+    escapes, integers beyond 64 bits) is parsed by json.loads, so results never
+    depend on whether orjson is installed. Raises json.JSONDecodeError on
+    malformed input.
+    """
+    if orjson is not None and LONG_DIGIT_RUN not in data.translate(DIGITS_TO_ZERO):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def tool_result_text(result: dict[str, object] | str) -> str:
+    """Serialize a tool result to the JSON text carried in an MCP text content item.
+
+    Tools that already return text (the Markdown report) are passed through.
+    Results are serialized compactly: indentation would add ~25% to every
+    payload, and each newline is escaped again inside the JSON-RPC envelope.
+    """
+    if isinstance(result, str):
+        return result
+    return json_dumps(result).decode('utf-8')
+
+def canonical_json(data: object) -> bytes:
+    """Serialize data with sorted keys so equal arguments give identical bytes.
+
+    Only used to build cache keys from request arguments, where canonical order
+    is what makes equal argument sets hit the same entry.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return CANONICAL_JSON_ENCODE(data).encode('utf-8')
+
+# Tool calls whose canonical arguments exceed this size bypass the cache, which
+# bounds the memory held by cache keys to roughly maxsize * this many bytes
+MAX_CACHED_ARGUMENTS_SIZE = 16_384
+
+class ToolCall:
+    """A tool invocation that hashes and compares by its canonical arguments only.
+
+    The canonical bytes are sorted by key so equal argument sets share a cache
+    entry, while the tool runs on the caller's arguments, whose key order it
+    echoes back. Those are dropped once the result is cached.
+    """
+
+    __slots__ = ('tool', 'canonical_args', 'arguments')
+
+    def __init__(self, tool: Callable[[dict[str, object]], dict[str, object] | str],
+                 canonical_args: bytes, arguments: object):
+        self.tool = tool
+        self.canonical_args = canonical_args
+        self.arguments = arguments
+
+    def __hash__(self) -> int:
+        return hash((self.tool, self.canonical_args))
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, ToolCall) and self.tool is other.tool
+                and self.canonical_args == other.canonical_args)
+
+    def run(self) -> str:
+        """Run the tool on a private copy of the arguments and return its MCP text."""
+        arguments, self.arguments = self.arguments, None
+        return tool_result_text(self.tool(json_loads(json_dumps(arguments))))
+
+@functools.lru_cache(maxsize=128)
+def cached_tool_json(call: ToolCall) -> bytes:
+    """Run a deterministic tool once per distinct argument set and cache its text as JSON.
+
+    Keyed on the tool function itself plus its canonicalized arguments; the tool
+    runs on a copy of the arguments so the cached result never aliases the
+    caller's request data. The text is stored already encoded as a JSON string,
+    ready to splice into a response.
+    """
+    return json_dumps(call.run())
+
+def tool_text_json(tool: Callable[[dict[str, object]], dict[str, object] | str], arguments: object) -> bytes:
+    """Return a tool's MCP text encoded as a JSON string, memoized when its arguments are small enough."""
+    canonical_args = canonical_json(arguments)
+    if len(canonical_args) <= MAX_CACHED_ARGUMENTS_SIZE:
+        return cached_tool_json(ToolCall(tool, canonical_args, arguments))
+    return json_dumps(tool_result_text(tool(arguments)))
+
 # Simplified tool implementations for Vercel deployment
 # Note: These provide framework and guidance for LLM client analysis
 
@@ -50,7 +188,7 @@ def sanitize_error(error: Exception, error_context: str = "") -> tuple[str, str]
         - Prevents leakage of: stack traces, file paths, internal implementation details
     """
     # Generate unique error ID for correlation
-    error_id = str(uuid.uuid4())[:8]
+    error_id = os.urandom(4).hex()
 
     # Log detailed error information to server logs (stderr goes to Vercel logs)
     print(f"[ERROR {error_id}] Context: {error_context}", file=sys.stderr)
@@ -64,7 +202,7 @@ def sanitize_error(error: Exception, error_context: str = "") -> tuple[str, str]
 
     return error_id, sanitized_message
 
-def validate_json_complexity(data: Any, current_depth: int = 0) -> Dict[str, Any]:
+def validate_json_complexity(data: object, current_depth: int = 0) -> dict[str, object]:
     """
     Recursively validate JSON complexity to prevent DoS attacks.
 
@@ -78,28 +216,28 @@ def validate_json_complexity(data: Any, current_depth: int = 0) -> Dict[str, Any
         Dict with 'valid' (bool) and 'error' (str) if invalid
     """
     # Check depth limit
-    if current_depth > PAYLOAD_LIMITS['MAX_JSON_DEPTH']:
+    if current_depth > MAX_JSON_DEPTH:
         return {
             'valid': False,
-            'error': f"JSON nesting depth exceeds maximum of {PAYLOAD_LIMITS['MAX_JSON_DEPTH']}"
+            'error': f"JSON nesting depth exceeds maximum of {MAX_JSON_DEPTH}"
         }
 
     # Validate dictionaries/objects
     if isinstance(data, dict):
         # Check number of keys
-        if len(data) > PAYLOAD_LIMITS['MAX_OBJECT_KEYS']:
+        if len(data) > MAX_OBJECT_KEYS:
             return {
                 'valid': False,
-                'error': f"Object contains {len(data)} keys, exceeds maximum of {PAYLOAD_LIMITS['MAX_OBJECT_KEYS']}"
+                'error': f"Object contains {len(data)} keys, exceeds maximum of {MAX_OBJECT_KEYS}"
             }
 
         # Recursively validate values
         for key, value in data.items():
             # Validate key length
-            if isinstance(key, str) and len(key) > PAYLOAD_LIMITS['MAX_STRING_LENGTH']:
+            if isinstance(key, str) and len(key) > MAX_STRING_LENGTH:
                 return {
                     'valid': False,
-                    'error': f"Object key length exceeds maximum of {PAYLOAD_LIMITS['MAX_STRING_LENGTH']}"
+                    'error': f"Object key length exceeds maximum of {MAX_STRING_LENGTH}"
                 }
 
             # Recursively validate value
@@ -110,10 +248,10 @@ def validate_json_complexity(data: Any, current_depth: int = 0) -> Dict[str, Any
     # Validate arrays
     elif isinstance(data, list):
         # Check array length
-        if len(data) > PAYLOAD_LIMITS['MAX_ARRAY_LENGTH']:
+        if len(data) > MAX_ARRAY_LENGTH:
             return {
                 'valid': False,
-                'error': f"Array length {len(data)} exceeds maximum of {PAYLOAD_LIMITS['MAX_ARRAY_LENGTH']}"
+                'error': f"Array length {len(data)} exceeds maximum of {MAX_ARRAY_LENGTH}"
             }
 
         # Recursively validate elements
@@ -124,10 +262,10 @@ def validate_json_complexity(data: Any, current_depth: int = 0) -> Dict[str, Any
 
     # Validate strings
     elif isinstance(data, str):
-        if len(data) > PAYLOAD_LIMITS['MAX_STRING_LENGTH']:
+        if len(data) > MAX_STRING_LENGTH:
             return {
                 'valid': False,
-                'error': f"String length {len(data)} exceeds maximum of {PAYLOAD_LIMITS['MAX_STRING_LENGTH']}"
+                'error': f"String length {len(data)} exceeds maximum of {MAX_STRING_LENGTH}"
             }
 
     # Other types (int, float, bool, None) are inherently safe
@@ -135,126 +273,185 @@ def validate_json_complexity(data: Any, current_depth: int = 0) -> Dict[str, Any
     return {'valid': True, 'error': None}
 
 
-def get_stride_threat_framework(args: Dict[str, Any]) -> Dict[str, Any]:
+def parse_content_length(raw: str) -> int | None:
+    """
+    Parse a present Content-Length header without exception-driven control flow.
+
+    Returns the length, or None when the value is empty or not a plain ASCII
+    decimal of at most 19 digits. An absent header is the caller's to handle.
+    """
+    if not raw or len(raw) > 19 or not (raw.isascii() and raw.isdigit()):
+        return None
+    return int(raw)
+
+def payload_within_limits(raw: bytes | bytearray) -> bool:
+    """
+    Cheap conservative precheck that raw JSON bytes cannot exceed PAYLOAD_LIMITS.
+
+    Byte counts over the raw payload (including any inside strings) are upper
+    bounds on nesting depth, container size, and string length, so a True result
+    guarantees validate_json_complexity would pass and the full traversal can be
+    skipped. A False result is inconclusive and the full traversal must run.
+    """
+    if len(raw) > MAX_STRING_LENGTH:
+        return False
+
+    # Every level of nesting needs its own opening bracket
+    if raw.count(b'{') + raw.count(b'[') > MAX_JSON_DEPTH:
+        return False
+
+    # Every element after the first in an object or array needs a comma
+    return raw.count(b',') < min(MAX_OBJECT_KEYS, MAX_ARRAY_LENGTH)
+
+
+# Static framework content is built once at import time and shared by every
+# call; tool functions only attach the per-call context around it. Tool results
+# reference these objects directly, so treat them (and the results' framework
+# entries) as read-only.
+STRIDE_FRAMEWORK = {
+    "description": "STRIDE threat modeling methodology for systematic security analysis",
+    "categories": {
+        "S": {
+            "name": "Spoofing",
+            "description": "Impersonating something or someone else",
+            "threat_examples": [
+                "Authentication bypass",
+                "Identity theft/impersonation",
+                "Credential compromise",
+                "Session hijacking",
+                "Certificate/token forgery"
+            ]
+        },
+        "T": {
+            "name": "Tampering",
+            "description": "Modifying data or code",
+            "threat_examples": [
+                "Data manipulation/corruption",
+                "Code injection attacks",
+                "Configuration modification",
+                "Message/request tampering",
+                "File/database alteration"
+            ]
+        },
+        "R": {
+            "name": "Repudiation",
+            "description": "Claiming to have not performed an action",
+            "threat_examples": [
+                "Insufficient audit logging",
+                "Log tampering/deletion",
+                "Non-repudiation failures",
+                "Transaction denial",
+                "Accountability gaps"
+            ]
+        },
+        "I": {
+            "name": "Information Disclosure",
+            "description": "Exposing information to unauthorized individuals",
+            "threat_examples": [
+                "Unauthorized data access",
+                "Sensitive information leakage",
+                "Privacy violations",
+                "Reconnaissance/enumeration",
+                "Metadata exposure"
+            ]
+        },
+        "D": {
+            "name": "Denial of Service",
+            "description": "Denying or degrading service availability",
+            "threat_examples": [
+                "Resource exhaustion",
+                "Service flooding/overload",
+                "Infrastructure disruption",
+                "Performance degradation",
+                "Availability attacks"
+            ]
+        },
+        "E": {
+            "name": "Elevation of Privilege",
+            "description": "Gaining capabilities without proper authorization",
+            "threat_examples": [
+                "Authorization bypass",
+                "Privilege escalation",
+                "Access control violations",
+                "Administrative compromise",
+                "Permission boundary failures"
+            ]
+        }
+    },
+    "extended_threat_domains": {
+        "traditional_web": [
+            "SQL injection, XSS, CSRF",
+            "Authentication/authorization flaws",
+            "Session management issues",
+            "Input validation failures"
+        ],
+        "cloud_infrastructure": [
+            "Misconfigured services/permissions",
+            "Container/orchestration vulnerabilities",
+            "API gateway security issues",
+            "Serverless function attacks"
+        ],
+        "ai_ml_systems": [
+            "Prompt injection attacks",
+            "Training data poisoning",
+            "Model extraction/inversion",
+            "Adversarial examples",
+            "Excessive AI agency",
+            "AI decision manipulation"
+        ],
+        "iot_embedded": [
+            "Firmware tampering",
+            "Device impersonation",
+            "Communication protocol attacks",
+            "Physical access threats"
+        ],
+        "mobile_applications": [
+            "App tampering/repackaging",
+            "Device-specific attacks",
+            "Platform integration issues",
+            "Local data storage threats"
+        ],
+        "api_microservices": [
+            "Service-to-service authentication",
+            "API abuse/rate limiting",
+            "Inter-service communication",
+            "Service mesh security"
+        ]
+    }
+}
+
+STRIDE_ANALYSIS_GUIDANCE = "Use this STRIDE framework to systematically identify specific threats for the described application. Consider which extended threat domains are relevant based on the application's architecture, technology stack, and deployment model. The LLM client should analyze the application context and select appropriate threats from each STRIDE category and relevant threat domain."
+
+STRIDE_NEXT_STEPS = {
+    "recommended_workflow": [
+        "1. Analyze application using STRIDE framework to identify specific threats",
+        "2. Document each threat with ID, category, and description",
+        "3. Call calculate_threat_risk_scores with your threat list",
+        "4. Call validate_threat_coverage to check completeness",
+        "5. Generate mitigations for high-priority threats"
+    ],
+    "optional_tools": [
+        "create_threat_attack_trees - Visualize attack paths",
+        "generate_security_tests - Create test cases"
+    ]
+}
+
+# Defaults for omitted arguments. They are echoed back in the caller-visible
+# application context, so they are kept as tuples and copied into a fresh list
+# per call rather than letting a caller's mutation reach every later call
+DEFAULT_AUTHENTICATION_METHODS = ('Username/Password',)
+DEFAULT_SENSITIVE_DATA_TYPES = ('User Data',)
+
+def get_stride_threat_framework(args: dict[str, object]) -> dict[str, object]:
     """Provide STRIDE threat modeling framework for LLM client analysis."""
     app_description = args.get('app_description', '')
     app_type = args.get('app_type', 'Web Application')
-    auth_methods = args.get('authentication_methods', ['Username/Password'])
+    auth_methods = args['authentication_methods'] if 'authentication_methods' in args else list(DEFAULT_AUTHENTICATION_METHODS)
     internet_facing = args.get('internet_facing', True)
-    sensitive_data = args.get('sensitive_data_types', ['User Data'])
+    sensitive_data = args['sensitive_data_types'] if 'sensitive_data_types' in args else list(DEFAULT_SENSITIVE_DATA_TYPES)
 
     return {
-        "stride_framework": {
-            "description": "STRIDE threat modeling methodology for systematic security analysis",
-            "categories": {
-                "S": {
-                    "name": "Spoofing",
-                    "description": "Impersonating something or someone else",
-                    "threat_examples": [
-                        "Authentication bypass",
-                        "Identity theft/impersonation",
-                        "Credential compromise",
-                        "Session hijacking",
-                        "Certificate/token forgery"
-                    ]
-                },
-                "T": {
-                    "name": "Tampering",
-                    "description": "Modifying data or code",
-                    "threat_examples": [
-                        "Data manipulation/corruption",
-                        "Code injection attacks",
-                        "Configuration modification",
-                        "Message/request tampering",
-                        "File/database alteration"
-                    ]
-                },
-                "R": {
-                    "name": "Repudiation",
-                    "description": "Claiming to have not performed an action",
-                    "threat_examples": [
-                        "Insufficient audit logging",
-                        "Log tampering/deletion",
-                        "Non-repudiation failures",
-                        "Transaction denial",
-                        "Accountability gaps"
-                    ]
-                },
-                "I": {
-                    "name": "Information Disclosure",
-                    "description": "Exposing information to unauthorized individuals",
-                    "threat_examples": [
-                        "Unauthorized data access",
-                        "Sensitive information leakage",
-                        "Privacy violations",
-                        "Reconnaissance/enumeration",
-                        "Metadata exposure"
-                    ]
-                },
-                "D": {
-                    "name": "Denial of Service",
-                    "description": "Denying or degrading service availability",
-                    "threat_examples": [
-                        "Resource exhaustion",
-                        "Service flooding/overload",
-                        "Infrastructure disruption",
-                        "Performance degradation",
-                        "Availability attacks"
-                    ]
-                },
-                "E": {
-                    "name": "Elevation of Privilege",
-                    "description": "Gaining capabilities without proper authorization",
-                    "threat_examples": [
-                        "Authorization bypass",
-                        "Privilege escalation",
-                        "Access control violations",
-                        "Administrative compromise",
-                        "Permission boundary failures"
-                    ]
-                }
-            },
-            "extended_threat_domains": {
-                "traditional_web": [
-                    "SQL injection, XSS, CSRF",
-                    "Authentication/authorization flaws",
-                    "Session management issues",
-                    "Input validation failures"
-                ],
-                "cloud_infrastructure": [
-                    "Misconfigured services/permissions",
-                    "Container/orchestration vulnerabilities",
-                    "API gateway security issues",
-                    "Serverless function attacks"
-                ],
-                "ai_ml_systems": [
-                    "Prompt injection attacks",
-                    "Training data poisoning",
-                    "Model extraction/inversion",
-                    "Adversarial examples",
-                    "Excessive AI agency",
-                    "AI decision manipulation"
-                ],
-                "iot_embedded": [
-                    "Firmware tampering",
-                    "Device impersonation",
-                    "Communication protocol attacks",
-                    "Physical access threats"
-                ],
-                "mobile_applications": [
-                    "App tampering/repackaging",
-                    "Device-specific attacks",
-                    "Platform integration issues",
-                    "Local data storage threats"
-                ],
-                "api_microservices": [
-                    "Service-to-service authentication",
-                    "API abuse/rate limiting",
-                    "Inter-service communication",
-                    "Service mesh security"
-                ]
-            }
-        },
+        "stride_framework": STRIDE_FRAMEWORK,
         "application_context": {
             "app_description": app_description,
             "app_type": app_type,
@@ -262,462 +459,461 @@ def get_stride_threat_framework(args: Dict[str, Any]) -> Dict[str, Any]:
             "internet_facing": internet_facing,
             "sensitive_data_types": sensitive_data
         },
-        "analysis_guidance": "Use this STRIDE framework to systematically identify specific threats for the described application. Consider which extended threat domains are relevant based on the application's architecture, technology stack, and deployment model. The LLM client should analyze the application context and select appropriate threats from each STRIDE category and relevant threat domain.",
-        "next_steps": {
-            "recommended_workflow": [
-                "1. Analyze application using STRIDE framework to identify specific threats",
-                "2. Document each threat with ID, category, and description",
-                "3. Call calculate_threat_risk_scores with your threat list",
-                "4. Call validate_threat_coverage to check completeness",
-                "5. Generate mitigations for high-priority threats"
-            ],
-            "optional_tools": [
-                "create_threat_attack_trees - Visualize attack paths",
-                "generate_security_tests - Create test cases"
-            ]
-        }
+        "analysis_guidance": STRIDE_ANALYSIS_GUIDANCE,
+        "next_steps": STRIDE_NEXT_STEPS
+    }
+
+MITIGATION_FRAMEWORK = {
+    "description": "Structured approach to generate threat mitigations",
+    "categories": {
+        "Preventive": "Controls that prevent threats from occurring",
+        "Detective": "Controls that detect when threats occur",
+        "Corrective": "Controls that respond to and recover from threats"
+    },
+    "difficulty_levels": {
+        "Easy": "Can be implemented quickly with existing tools/processes",
+        "Medium": "Requires moderate effort and possibly new tools",
+        "Hard": "Requires significant resources, time, or architectural changes"
+    },
+    "priority_levels": {
+        "High": "Critical security controls that should be implemented immediately",
+        "Medium": "Important controls that should be planned for near-term implementation",
+        "Low": "Nice-to-have controls for comprehensive defense"
     }
+}
+
+MITIGATION_ANALYSIS_GUIDANCE = "For each threat provided, generate specific, actionable mitigation strategies. Consider defense-in-depth principles and prioritize based on risk level and implementation difficulty."
+
+MITIGATION_NEXT_STEPS = {
+    "after_mitigations": [
+        "1. Call generate_security_tests to create test cases",
+        "2. Call create_threat_attack_trees to visualize attack paths",
+        "3. Call generate_threat_report to create deliverable document",
+        "4. Implement high-priority preventive controls first"
+    ]
+}
 
-def generate_threat_mitigations(args: Dict[str, Any]) -> Dict[str, Any]:
+def generate_threat_mitigations(args: dict[str, object]) -> dict[str, object]:
     """Provide mitigation framework for LLM client analysis."""
     threats = args.get('threats', [])
     priority_filter = args.get('priority_filter', 'all')
 
     return {
-        "mitigation_framework": {
-            "description": "Structured approach to generate threat mitigations",
-            "categories": {
-                "Preventive": "Controls that prevent threats from occurring",
-                "Detective": "Controls that detect when threats occur",
-                "Corrective": "Controls that respond to and recover from threats"
-            },
-            "difficulty_levels": {
-                "Easy": "Can be implemented quickly with existing tools/processes",
-                "Medium": "Requires moderate effort and possibly new tools",
-                "Hard": "Requires significant resources, time, or architectural changes"
-            },
-            "priority_levels": {
-                "High": "Critical security controls that should be implemented immediately",
-                "Medium": "Important controls that should be planned for near-term implementation",
-                "Low": "Nice-to-have controls for comprehensive defense"
-            }
-        },
+        "mitigation_framework": MITIGATION_FRAMEWORK,
         "threat_context": threats,
         "priority_filter": priority_filter,
-        "analysis_guidance": "For each threat provided, generate specific, actionable mitigation strategies. Consider defense-in-depth principles and prioritize based on risk level and implementation difficulty.",
-        "next_steps": {
-            "after_mitigations": [
-                "1. Call generate_security_tests to create test cases",
-                "2. Call create_threat_attack_trees to visualize attack paths",
-                "3. Call generate_threat_report to create deliverable document",
-                "4. Implement high-priority preventive controls first"
-            ]
+        "analysis_guidance": MITIGATION_ANALYSIS_GUIDANCE,
+        "next_steps": MITIGATION_NEXT_STEPS
+    }
+
+DREAD_FRAMEWORK = {
+    "description": "DREAD risk assessment methodology for threat prioritization",
+    "scoring_criteria": {
+        "Damage": {
+            "description": "How bad would an attack be?",
+            "scale": "1-10 (1=minimal damage, 10=complete system compromise)",
+            "factors": ["Financial impact", "Data sensitivity", "Regulatory consequences", "Business continuity"]
+        },
+        "Reproducibility": {
+            "description": "How easy is it to reproduce the attack?",
+            "scale": "1-10 (1=very difficult, 10=very easy)",
+            "factors": ["Attack complexity", "Required tools/skills", "Environmental dependencies"]
+        },
+        "Exploitability": {
+            "description": "How much work is it to launch the attack?",
+            "scale": "1-10 (1=very hard, 10=very easy)",
+            "factors": ["Technical skill required", "Time investment", "Resource requirements"]
+        },
+        "Affected_Users": {
+            "description": "How many users would be impacted?",
+            "scale": "1-10 (1=few users, 10=all users)",
+            "factors": ["User base size", "Impact scope", "Cascading effects"]
+        },
+        "Discoverability": {
+            "description": "How easy is it to discover the threat?",
+            "scale": "1-10 (1=very hard, 10=very easy)",
+            "factors": ["Visibility of attack surface", "Documentation availability", "Common vulnerability"]
         }
+    },
+    "risk_levels": {
+        "Critical": "40-50 points - Immediate action required",
+        "High": "30-39 points - High priority for remediation",
+        "Medium": "20-29 points - Medium priority",
+        "Low": "5-19 points - Low priority but should be addressed"
     }
+}
 
-def calculate_threat_risk_scores(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Provide DREAD scoring framework for LLM client analysis."""
-    threats = args.get('threats', [])
-    scoring_guidance = args.get('scoring_guidance', {})
+DREAD_CALIBRATION_GUIDANCE = {
+    "damage": {
+        "1-3": "Minimal: Affects single user, non-critical functionality, easily recoverable",
+        "4-6": "Moderate: Affects multiple users, important functionality, recovery required",
+        "7-9": "High: Affects most users, critical functionality, difficult recovery",
+        "10": "Catastrophic: Complete system compromise, all users affected, irrecoverable"
+    },
+    "reproducibility": {
+        "1-3": "Difficult: Requires specific timing, race conditions, or rare circumstances",
+        "4-6": "Moderate: Requires specific configuration or user actions",
+        "7-9": "Easy: Reproducible with standard tools and documentation",
+        "10": "Always: 100% reproducible, deterministic"
+    },
+    "exploitability": {
+        "1-3": "Expert: Requires deep expertise, custom tools, significant time investment",
+        "4-6": "Intermediate: Requires moderate skill, some tool customization",
+        "7-9": "Basic: Standard tools and scripts available, minimal expertise needed",
+        "10": "Trivial: No technical skill required, fully automated tools exist"
+    },
+    "affected_users": {
+        "1-3": "Few: < 10% of users, isolated impact",
+        "4-6": "Some: 10-50% of users, limited scope",
+        "7-9": "Most: 50-90% of users, widespread impact",
+        "10": "All: 100% of users affected, system-wide impact"
+    },
+    "discoverability": {
+        "1-3": "Hidden: Requires source code review, insider knowledge, or deep analysis",
+        "4-6": "Obscure: Requires investigation, testing, or documentation review",
+        "7-9": "Obvious: Visible through normal usage or basic testing",
+        "10": "Public: Documented, well-known, or immediately apparent"
+    }
+}
 
-    return {
-        "dread_framework": {
-            "description": "DREAD risk assessment methodology for threat prioritization",
-            "scoring_criteria": {
-                "Damage": {
-                    "description": "How bad would an attack be?",
-                    "scale": "1-10 (1=minimal damage, 10=complete system compromise)",
-                    "factors": ["Financial impact", "Data sensitivity", "Regulatory consequences", "Business continuity"]
-                },
-                "Reproducibility": {
-                    "description": "How easy is it to reproduce the attack?",
-                    "scale": "1-10 (1=very difficult, 10=very easy)",
-                    "factors": ["Attack complexity", "Required tools/skills", "Environmental dependencies"]
-                },
-                "Exploitability": {
-                    "description": "How much work is it to launch the attack?",
-                    "scale": "1-10 (1=very hard, 10=very easy)",
-                    "factors": ["Technical skill required", "Time investment", "Resource requirements"]
-                },
-                "Affected_Users": {
-                    "description": "How many users would be impacted?",
-                    "scale": "1-10 (1=few users, 10=all users)",
-                    "factors": ["User base size", "Impact scope", "Cascading effects"]
-                },
-                "Discoverability": {
-                    "description": "How easy is it to discover the threat?",
-                    "scale": "1-10 (1=very hard, 10=very easy)",
-                    "factors": ["Visibility of attack surface", "Documentation availability", "Common vulnerability"]
-                }
+DREAD_SCORING_EXAMPLES = [
+    {
+        "threat": "SQL Injection in public-facing API endpoint",
+        "context": "E-commerce website with customer database",
+        "dread_breakdown": {
+            "Damage": {
+                "score": 10,
+                "rationale": "Complete database compromise, customer PII exposure, financial data theft"
             },
-            "risk_levels": {
-                "Critical": "40-50 points - Immediate action required",
-                "High": "30-39 points - High priority for remediation",
-                "Medium": "20-29 points - Medium priority",
-                "Low": "5-19 points - Low priority but should be addressed"
-            }
-        },
-        "calibration_guidance": {
-            "damage": {
-                "1-3": "Minimal: Affects single user, non-critical functionality, easily recoverable",
-                "4-6": "Moderate: Affects multiple users, important functionality, recovery required",
-                "7-9": "High: Affects most users, critical functionality, difficult recovery",
-                "10": "Catastrophic: Complete system compromise, all users affected, irrecoverable"
+            "Reproducibility": {
+                "score": 9,
+                "rationale": "Easily reproducible with standard tools (SQLMap), well-documented technique"
             },
-            "reproducibility": {
-                "1-3": "Difficult: Requires specific timing, race conditions, or rare circumstances",
-                "4-6": "Moderate: Requires specific configuration or user actions",
-                "7-9": "Easy: Reproducible with standard tools and documentation",
-                "10": "Always: 100% reproducible, deterministic"
+            "Exploitability": {
+                "score": 8,
+                "rationale": "Requires basic SQL knowledge, automated tools available, public exploits exist"
             },
-            "exploitability": {
-                "1-3": "Expert: Requires deep expertise, custom tools, significant time investment",
-                "4-6": "Intermediate: Requires moderate skill, some tool customization",
-                "7-9": "Basic: Standard tools and scripts available, minimal expertise needed",
-                "10": "Trivial: No technical skill required, fully automated tools exist"
+            "Affected_Users": {
+                "score": 10,
+                "rationale": "All users' data potentially exposed, entire database accessible"
             },
-            "affected_users": {
-                "1-3": "Few: < 10% of users, isolated impact",
-                "4-6": "Some: 10-50% of users, limited scope",
-                "7-9": "Most: 50-90% of users, widespread impact",
-                "10": "All: 100% of users affected, system-wide impact"
+            "Discoverability": {
+                "score": 9,
+                "rationale": "Common vulnerability, easily detected by automated scanners, OWASP Top 10"
             },
-            "discoverability": {
-                "1-3": "Hidden: Requires source code review, insider knowledge, or deep analysis",
-                "4-6": "Obscure: Requires investigation, testing, or documentation review",
-                "7-9": "Obvious: Visible through normal usage or basic testing",
-                "10": "Public: Documented, well-known, or immediately apparent"
-            }
-        },
-        "scoring_examples": [
-            {
-                "threat": "SQL Injection in public-facing API endpoint",
-                "context": "E-commerce website with customer database",
-                "dread_breakdown": {
-                    "Damage": {
-                        "score": 10,
-                        "rationale": "Complete database compromise, customer PII exposure, financial data theft"
-                    },
-                    "Reproducibility": {
-                        "score": 9,
-                        "rationale": "Easily reproducible with standard tools (SQLMap), well-documented technique"
-                    },
-                    "Exploitability": {
-                        "score": 8,
-                        "rationale": "Requires basic SQL knowledge, automated tools available, public exploits exist"
-                    },
-                    "Affected_Users": {
-                        "score": 10,
-                        "rationale": "All users' data potentially exposed, entire database accessible"
-                    },
-                    "Discoverability": {
-                        "score": 9,
-                        "rationale": "Common vulnerability, easily detected by automated scanners, OWASP Top 10"
-                    },
-                    "total": 46,
-                    "priority": "Critical"
-                }
+            "total": 46,
+            "priority": "Critical"
+        }
+    },
+    {
+        "threat": "Insufficient audit logging for admin actions",
+        "context": "Internal business application",
+        "dread_breakdown": {
+            "Damage": {
+                "score": 6,
+                "rationale": "Enables malicious activity without detection, complicates forensics, compliance risk"
             },
-            {
-                "threat": "Insufficient audit logging for admin actions",
-                "context": "Internal business application",
-                "dread_breakdown": {
-                    "Damage": {
-                        "score": 6,
-                        "rationale": "Enables malicious activity without detection, complicates forensics, compliance risk"
-                    },
-                    "Reproducibility": {
-                        "score": 10,
-                        "rationale": "Always reproducible - logging is either present or not"
-                    },
-                    "Exploitability": {
-                        "score": 5,
-                        "rationale": "Requires legitimate admin access first, not directly exploitable"
-                    },
-                    "Affected_Users": {
-                        "score": 7,
-                        "rationale": "Affects incident response capability, impacts all users indirectly"
-                    },
-                    "Discoverability": {
-                        "score": 6,
-                        "rationale": "Requires code review or documentation review to discover"
-                    },
-                    "total": 34,
-                    "priority": "High"
-                }
+            "Reproducibility": {
+                "score": 10,
+                "rationale": "Always reproducible - logging is either present or not"
             },
-            {
-                "threat": "Weak password policy (minimum 6 characters, no complexity)",
-                "context": "Consumer web application",
-                "dread_breakdown": {
-                    "Damage": {
-                        "score": 7,
-                        "rationale": "Individual account compromise, potential for credential stuffing"
-                    },
-                    "Reproducibility": {
-                        "score": 8,
-                        "rationale": "Brute force attacks are reliable with weak passwords"
-                    },
-                    "Exploitability": {
-                        "score": 7,
-                        "rationale": "Requires password hash access or online brute force, standard tools available"
-                    },
-                    "Affected_Users": {
-                        "score": 6,
-                        "rationale": "Affects users who choose weak passwords, not all users"
-                    },
-                    "Discoverability": {
-                        "score": 8,
-                        "rationale": "Easily discoverable during registration or password change"
-                    },
-                    "total": 36,
-                    "priority": "High"
-                }
+            "Exploitability": {
+                "score": 5,
+                "rationale": "Requires legitimate admin access first, not directly exploitable"
             },
-            {
-                "threat": "Missing CSRF protection on low-impact form",
-                "context": "User preference settings update",
-                "dread_breakdown": {
-                    "Damage": {
-                        "score": 3,
-                        "rationale": "Limited to changing non-critical user preferences"
-                    },
-                    "Reproducibility": {
-                        "score": 8,
-                        "rationale": "Easily reproducible with standard CSRF techniques"
-                    },
-                    "Exploitability": {
-                        "score": 6,
-                        "rationale": "Requires social engineering to get user to visit malicious page"
-                    },
-                    "Affected_Users": {
-                        "score": 4,
-                        "rationale": "Affects individual users who fall victim to social engineering"
-                    },
-                    "Discoverability": {
-                        "score": 7,
-                        "rationale": "Detectable with automated security scanners"
-                    },
-                    "total": 28,
-                    "priority": "Medium"
-                }
+            "Affected_Users": {
+                "score": 7,
+                "rationale": "Affects incident response capability, impacts all users indirectly"
             },
-            {
-                "threat": "Information disclosure via verbose error messages",
-                "context": "Stack traces exposed to users in production",
-                "dread_breakdown": {
-                    "Damage": {
-                        "score": 5,
-                        "rationale": "Reveals internal structure, file paths, technology versions - aids reconnaissance"
-                    },
-                    "Reproducibility": {
-                        "score": 7,
-                        "rationale": "Reproducible by triggering error conditions"
-                    },
-                    "Exploitability": {
-                        "score": 6,
-                        "rationale": "Requires ability to trigger errors, not directly exploitable"
-                    },
-                    "Affected_Users": {
-                        "score": 5,
-                        "rationale": "Information disclosure to potential attackers, indirect user impact"
-                    },
-                    "Discoverability": {
-                        "score": 8,
-                        "rationale": "Easily discovered through normal usage and error triggering"
-                    },
-                    "total": 31,
-                    "priority": "High"
-                }
-            }
-        ],
-        "threats": threats,
-        "scoring_guidance": scoring_guidance,
-        "analysis_guidance": "Score each threat using the DREAD criteria. Provide justification for each score based on the specific threat characteristics and application context.",
-        "next_steps": {
-            "after_scoring": [
-                "1. Prioritize threats by DREAD score (Critical: 40-50, High: 30-39)",
-                "2. Call validate_threat_coverage to ensure no gaps",
-                "3. Call generate_threat_mitigations for high-priority threats",
-                "4. Consider create_threat_attack_trees for critical threats"
-            ]
+            "Discoverability": {
+                "score": 6,
+                "rationale": "Requires code review or documentation review to discover"
+            },
+            "total": 34,
+            "priority": "High"
+        }
+    },
+    {
+        "threat": "Weak password policy (minimum 6 characters, no complexity)",
+        "context": "Consumer web application",
+        "dread_breakdown": {
+            "Damage": {
+                "score": 7,
+                "rationale": "Individual account compromise, potential for credential stuffing"
+            },
+            "Reproducibility": {
+                "score": 8,
+                "rationale": "Brute force attacks are reliable with weak passwords"
+            },
+            "Exploitability": {
+                "score": 7,
+                "rationale": "Requires password hash access or online brute force, standard tools available"
+            },
+            "Affected_Users": {
+                "score": 6,
+                "rationale": "Affects users who choose weak passwords, not all users"
+            },
+            "Discoverability": {
+                "score": 8,
+                "rationale": "Easily discoverable during registration or password change"
+            },
+            "total": 36,
+            "priority": "High"
+        }
+    },
+    {
+        "threat": "Missing CSRF protection on low-impact form",
+        "context": "User preference settings update",
+        "dread_breakdown": {
+            "Damage": {
+                "score": 3,
+                "rationale": "Limited to changing non-critical user preferences"
+            },
+            "Reproducibility": {
+                "score": 8,
+                "rationale": "Easily reproducible with standard CSRF techniques"
+            },
+            "Exploitability": {
+                "score": 6,
+                "rationale": "Requires social engineering to get user to visit malicious page"
+            },
+            "Affected_Users": {
+                "score": 4,
+                "rationale": "Affects individual users who fall victim to social engineering"
+            },
+            "Discoverability": {
+                "score": 7,
+                "rationale": "Detectable with automated security scanners"
+            },
+            "total": 28,
+            "priority": "Medium"
+        }
+    },
+    {
+        "threat": "Information disclosure via verbose error messages",
+        "context": "Stack traces exposed to users in production",
+        "dread_breakdown": {
+            "Damage": {
+                "score": 5,
+                "rationale": "Reveals internal structure, file paths, technology versions - aids reconnaissance"
+            },
+            "Reproducibility": {
+                "score": 7,
+                "rationale": "Reproducible by triggering error conditions"
+            },
+            "Exploitability": {
+                "score": 6,
+                "rationale": "Requires ability to trigger errors, not directly exploitable"
+            },
+            "Affected_Users": {
+                "score": 5,
+                "rationale": "Information disclosure to potential attackers, indirect user impact"
+            },
+            "Discoverability": {
+                "score": 8,
+                "rationale": "Easily discovered through normal usage and error triggering"
+            },
+            "total": 31,
+            "priority": "High"
         }
     }
+]
 
-def create_threat_attack_trees(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Provide attack tree framework for LLM client analysis."""
+DREAD_ANALYSIS_GUIDANCE = "Score each threat using the DREAD criteria. Provide justification for each score based on the specific threat characteristics and application context."
+
+DREAD_NEXT_STEPS = {
+    "after_scoring": [
+        "1. Prioritize threats by DREAD score (Critical: 40-50, High: 30-39)",
+        "2. Call validate_threat_coverage to ensure no gaps",
+        "3. Call generate_threat_mitigations for high-priority threats",
+        "4. Consider create_threat_attack_trees for critical threats"
+    ]
+}
+
+def calculate_threat_risk_scores(args: dict[str, object]) -> dict[str, object]:
+    """Provide DREAD scoring framework for LLM client analysis."""
     threats = args.get('threats', [])
-    max_depth = args.get('max_depth', 3)
-    output_format = args.get('output_format', 'both')
+    scoring_guidance = args.get('scoring_guidance', {})
 
     return {
-        "attack_tree_framework": {
-            "description": "Hierarchical representation of attack paths and methods",
-            "structure": {
-                "root_goal": "Primary objective the attacker wants to achieve",
-                "sub_goals": "Intermediate objectives that support the root goal",
-                "attack_methods": "Specific techniques or vulnerabilities that enable each sub-goal",
-                "prerequisites": "Conditions or access required for each attack method"
-            },
-            "common_patterns": {
-                "reconnaissance": ["Information gathering", "System enumeration", "Social engineering"],
-                "initial_access": ["Phishing", "Credential stuffing", "Vulnerability exploitation"],
-                "privilege_escalation": ["Local exploits", "Credential theft", "Authorization bypass"],
-                "persistence": ["Backdoors", "Scheduled tasks", "Registry modification"],
-                "exfiltration": ["Data staging", "Command and control", "Covert channels"]
-            }
-        },
-        "output_formats": {
-            "text": {
-                "description": "ASCII tree structure using └── and ├── characters",
-                "example": """Goal: Steal API Keys
+        "dread_framework": DREAD_FRAMEWORK,
+        "calibration_guidance": DREAD_CALIBRATION_GUIDANCE,
+        "scoring_examples": DREAD_SCORING_EXAMPLES,
+        "threats": threats,
+        "scoring_guidance": scoring_guidance,
+        "analysis_guidance": DREAD_ANALYSIS_GUIDANCE,
+        "next_steps": DREAD_NEXT_STEPS
+    }
+
+ATTACK_TREE_FRAMEWORK = {
+    "description": "Hierarchical representation of attack paths and methods",
+    "structure": {
+        "root_goal": "Primary objective the attacker wants to achieve",
+        "sub_goals": "Intermediate objectives that support the root goal",
+        "attack_methods": "Specific techniques or vulnerabilities that enable each sub-goal",
+        "prerequisites": "Conditions or access required for each attack method"
+    },
+    "common_patterns": {
+        "reconnaissance": ["Information gathering", "System enumeration", "Social engineering"],
+        "initial_access": ["Phishing", "Credential stuffing", "Vulnerability exploitation"],
+        "privilege_escalation": ["Local exploits", "Credential theft", "Authorization bypass"],
+        "persistence": ["Backdoors", "Scheduled tasks", "Registry modification"],
+        "exfiltration": ["Data staging", "Command and control", "Covert channels"]
+    }
+}
+
+ATTACK_TREE_OUTPUT_FORMATS = {
+    "text": {
+        "description": "ASCII tree structure using └── and ├── characters",
+        "example": """Goal: Steal API Keys
 ├── [OR] Exploit Public Deployment
 │   ├── Access public instance
 │   └── Extract from browser
 └── [OR] Exploit Local Deployment
     └── Read .env file"""
-            },
-            "mermaid": {
-                "description": "Mermaid.js graph syntax for rendering diagrams",
-                "example": """graph TD
+    },
+    "mermaid": {
+        "description": "Mermaid.js graph syntax for rendering diagrams",
+        "example": """graph TD
     A[Steal API Keys] --> B{OR}
     B --> C[Exploit Public]
     B --> D[Exploit Local]
     C --> E[Access instance]
     C --> F[Extract from browser]
     D --> G[Read .env file]"""
-            },
-            "json": {
-                "description": "Structured JSON representation",
-                "example": {
-                    "root": "Steal API Keys",
-                    "type": "OR",
-                    "children": [
-                        {
-                            "goal": "Exploit Public Deployment",
-                            "methods": ["Access instance", "Extract from browser"]
-                        }
-                    ]
+    },
+    "json": {
+        "description": "Structured JSON representation",
+        "example": {
+            "root": "Steal API Keys",
+            "type": "OR",
+            "children": [
+                {
+                    "goal": "Exploit Public Deployment",
+                    "methods": ["Access instance", "Extract from browser"]
                 }
-            },
-            "both": {
-                "description": "Returns both text and mermaid formats",
-                "note": "Current default, provides multiple visualization options"
-            }
-        },
+            ]
+        }
+    },
+    "both": {
+        "description": "Returns both text and mermaid formats",
+        "note": "Current default, provides multiple visualization options"
+    }
+}
+
+ATTACK_TREE_ANALYSIS_GUIDANCE = "Create attack trees showing how threats could be realized. Start with high-level attack goals and decompose into specific attack vectors and prerequisites."
+
+def create_threat_attack_trees(args: dict[str, object]) -> dict[str, object]:
+    """Provide attack tree framework for LLM client analysis."""
+    threats = args.get('threats', [])
+    max_depth = args.get('max_depth', 3)
+    output_format = args.get('output_format', 'both')
+
+    return {
+        "attack_tree_framework": ATTACK_TREE_FRAMEWORK,
+        "output_formats": ATTACK_TREE_OUTPUT_FORMATS,
         "threat_context": threats,
         "max_depth": max_depth,
         "output_format": output_format,
-        "analysis_guidance": "Create attack trees showing how threats could be realized. Start with high-level attack goals and decompose into specific attack vectors and prerequisites."
+        "analysis_guidance": ATTACK_TREE_ANALYSIS_GUIDANCE
     }
 
-def generate_security_tests(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Provide security testing framework for LLM client analysis."""
-    threats = args.get('threats', [])
-    test_type = args.get('test_type', 'mixed')
-    format_type = args.get('format_type', 'gherkin')
+SECURITY_TESTING_FRAMEWORK = {
+    "description": "Structured approach to validate threat mitigations through testing",
+    "test_types": {
+        "unit": "Test individual security controls in isolation",
+        "integration": "Test security controls working together",
+        "penetration": "Simulate real-world attack scenarios",
+        "compliance": "Verify adherence to security standards"
+    },
+    "test_formats": {
+        "gherkin": "Given-When-Then behavior-driven format",
+        "procedural": "Step-by-step test procedures",
+        "checklist": "Verification checklists"
+    },
+    "coverage_areas": {
+        "authentication": "Identity verification and access controls",
+        "authorization": "Permission and privilege validation",
+        "input_validation": "Data sanitization and bounds checking",
+        "encryption": "Data protection in transit and at rest",
+        "logging": "Security event detection and recording"
+    }
+}
 
-    return {
-        "security_testing_framework": {
-            "description": "Structured approach to validate threat mitigations through testing",
-            "test_types": {
-                "unit": "Test individual security controls in isolation",
-                "integration": "Test security controls working together",
-                "penetration": "Simulate real-world attack scenarios",
-                "compliance": "Verify adherence to security standards"
-            },
-            "test_formats": {
-                "gherkin": "Given-When-Then behavior-driven format",
-                "procedural": "Step-by-step test procedures",
-                "checklist": "Verification checklists"
-            },
-            "coverage_areas": {
-                "authentication": "Identity verification and access controls",
-                "authorization": "Permission and privilege validation",
-                "input_validation": "Data sanitization and bounds checking",
-                "encryption": "Data protection in transit and at rest",
-                "logging": "Security event detection and recording"
-            }
-        },
-        "use_cases": {
-            "unit_testing": {
-                "description": "Generate unit tests for security functions",
-                "example": "Test input validation, authentication checks, authorization logic"
-            },
-            "integration_testing": {
-                "description": "Generate integration tests for security flows",
-                "example": "Test end-to-end authentication, authorization workflows"
-            },
-            "manual_testing": {
-                "description": "Generate test cases for manual security testing",
-                "example": "Penetration testing checklists, security review procedures"
-            },
-            "automated_security_scanning": {
-                "description": "Generate test scenarios for security scanners",
-                "example": "DAST tool configurations, security test automation"
-            }
-        },
-        "format_examples": {
-            "gherkin": {
-                "description": "Behavior-driven development test scenarios",
-                "example": """Feature: API Authentication
+SECURITY_TEST_USE_CASES = {
+    "unit_testing": {
+        "description": "Generate unit tests for security functions",
+        "example": "Test input validation, authentication checks, authorization logic"
+    },
+    "integration_testing": {
+        "description": "Generate integration tests for security flows",
+        "example": "Test end-to-end authentication, authorization workflows"
+    },
+    "manual_testing": {
+        "description": "Generate test cases for manual security testing",
+        "example": "Penetration testing checklists, security review procedures"
+    },
+    "automated_security_scanning": {
+        "description": "Generate test scenarios for security scanners",
+        "example": "DAST tool configurations, security test automation"
+    }
+}
+
+SECURITY_TEST_FORMAT_EXAMPLES = {
+    "gherkin": {
+        "description": "Behavior-driven development test scenarios",
+        "example": """Feature: API Authentication
   Scenario: Unauthorized access attempt
     Given I am not authenticated
     When I attempt to access protected endpoint
     Then I should receive 401 Unauthorized
     And no sensitive data should be returned"""
-            },
-            "checklist": {
-                "description": "Manual testing checklist",
-                "example": """## SQL Injection Testing
+    },
+    "checklist": {
+        "description": "Manual testing checklist",
+        "example": """## SQL Injection Testing
 - [ ] Test input validation with SQL metacharacters
 - [ ] Verify parameterized queries are used
 - [ ] Check error messages don't reveal database structure
 - [ ] Test time-based blind injection"""
-            },
-            "markdown": {
-                "description": "Structured test documentation",
-                "example": """### Test Case: XSS Protection
+    },
+    "markdown": {
+        "description": "Structured test documentation",
+        "example": """### Test Case: XSS Protection
 **Objective**: Verify XSS prevention in user input fields
 **Steps**:
 1. Submit XSS payload in username field
 2. Verify output is properly escaped
 3. Check CSP headers are present
 **Expected**: Script tags rendered as text, not executed"""
-            }
-        },
-        "threat_context": threats,
-        "test_type": test_type,
-        "format_type": format_type,
-        "analysis_guidance": "Generate specific test cases to validate that security controls effectively mitigate the identified threats. Include both positive and negative test scenarios."
     }
+}
 
-def generate_threat_report(args: Dict[str, Any]) -> str:
-    """Return a Markdown report skeleton for the LLM client to populate.
+SECURITY_TEST_ANALYSIS_GUIDANCE = "Generate specific test cases to validate that security controls effectively mitigate the identified threats. Include both positive and negative test scenarios."
 
-    This does not produce finished analysis — it emits the section scaffold and
-    guidance for the client's model to fill in from the threat model, scores,
-    mitigations, and attack trees.
+def generate_security_tests(args: dict[str, object]) -> dict[str, object]:
+    """Provide security testing framework for LLM client analysis."""
+    threats = args.get('threats', [])
+    test_type = args.get('test_type', 'mixed')
+    format_type = args.get('format_type', 'gherkin')
 
-    NOTE: This skeleton is a parallel copy of the report house style that now lives
-    canonically in skills/stride-threat-modelling/references/report-format.md. It is
-    kept here for MCP clients without Agent Skills support. Keep the two in sync; the
-    skill is authoritative where available.
+    return {
+        "security_testing_framework": SECURITY_TESTING_FRAMEWORK,
+        "use_cases": SECURITY_TEST_USE_CASES,
+        "format_examples": SECURITY_TEST_FORMAT_EXAMPLES,
+        "threat_context": threats,
+        "test_type": test_type,
+        "format_type": format_type,
+        "analysis_guidance": SECURITY_TEST_ANALYSIS_GUIDANCE
+    }
 
-    CRITICAL: This function MUST return a string (the markdown report), not a dict.
-    The MCP handler expects content[0].text to be a string.
-    """
-    threat_model = args.get('threat_model', [])
-    mitigations = args.get('mitigations', [])
-    dread_scores = args.get('dread_scores', [])
-    attack_trees = args.get('attack_trees', [])
-    include_sections = args.get('include_sections', ['executive_summary', 'threats', 'mitigations', 'risk_scores'])
+# Report sections emitted by generate_threat_report; the closing section is
+# split around the threat count so no template formatting runs per call
+DEFAULT_REPORT_SECTIONS = ('executive_summary', 'threats', 'mitigations', 'risk_scores')
 
-    # Build the markdown report as a string
-    report = "# STRIDE Threat Model Report\n\n"
+REPORT_TITLE = "# STRIDE Threat Model Report\n\n"
 
-    if 'executive_summary' in include_sections:
-        report += """## Executive Summary
+REPORT_EXECUTIVE_SUMMARY = """## Executive Summary
 
 *This section should provide a high-level overview of the threat modeling exercise, key findings, and recommended actions.*
 
@@ -729,14 +925,13 @@ def generate_threat_report(args: Dict[str, Any]) -> str:
 
 """
 
-    report += """## Application Overview
+REPORT_APPLICATION_OVERVIEW = """## Application Overview
 
 *Describe the application architecture, components, and security-relevant characteristics based on the application context used for threat modeling.*
 
 """
 
-    if 'threats' in include_sections:
-        report += """## Threat Analysis
+REPORT_THREAT_ANALYSIS = """## Threat Analysis
 
 *Detail the identified threats organized by STRIDE category. For each threat, include:*
 - Threat ID
@@ -765,8 +960,7 @@ def generate_threat_report(args: Dict[str, Any]) -> str:
 
 """
 
-    if 'risk_scores' in include_sections:
-        report += """## Risk Assessment
+REPORT_RISK_ASSESSMENT = """## Risk Assessment
 
 *Provide DREAD scores and risk prioritization for identified threats.*
 
@@ -784,8 +978,7 @@ def generate_threat_report(args: Dict[str, Any]) -> str:
 
 """
 
-    if 'mitigations' in include_sections:
-        report += """## Recommended Mitigations
+REPORT_MITIGATIONS = """## Recommended Mitigations
 
 *Detail specific mitigation strategies organized by priority. For each mitigation:*
 - Control type (Preventive/Detective/Corrective)
@@ -804,7 +997,7 @@ def generate_threat_report(args: Dict[str, Any]) -> str:
 
 """
 
-    report += """## Security Testing Plan
+REPORT_CLOSING_HEAD = """## Security Testing Plan
 
 *Outline test cases to validate mitigation effectiveness. Include:*
 - Test scenarios for each major threat
@@ -823,7 +1016,9 @@ def generate_threat_report(args: Dict[str, Any]) -> str:
 ### Threat Model Data
 *Technical details about the threat model*
 
-**Total Threats Identified:** {threat_count}
+**Total Threats Identified:** """
+
+REPORT_CLOSING_TAIL = """
 
 ### STRIDE Coverage
 *Breakdown of threats by STRIDE category*
@@ -842,514 +1037,536 @@ def generate_threat_report(args: Dict[str, Any]) -> str:
 **Risk Scoring Method:** DREAD
 
 *This report was generated using the STRIDE GPT MCP Server threat modeling framework. The LLM client should populate each section with specific analysis based on the provided threat model data.*
-""".format(threat_count=len(threat_model) if isinstance(threat_model, list) else 0)
+"""
 
-    return report
+def generate_threat_report(args: dict[str, object]) -> str:
+    """Return a Markdown report skeleton for the LLM client to populate.
 
-def validate_threat_coverage(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Provide coverage validation framework for LLM client analysis."""
-    threat_model = args.get('threat_model', [])
-    app_context = args.get('app_context', {})
+    This does not produce finished analysis — it emits the section scaffold and
+    guidance for the client's model to fill in from the threat model, scores,
+    mitigations, and attack trees.
+
+    NOTE: This skeleton is a parallel copy of the report house style that now lives
+    canonically in skills/stride-threat-modelling/references/report-format.md. It is
+    kept here for MCP clients without Agent Skills support. Keep the two in sync; the
+    skill is authoritative where available.
+
+    CRITICAL: This function MUST return a string (the markdown report), not a dict.
+    The MCP handler expects content[0].text to be a string.
+    """
+    threat_model = args.get('threat_model', [])
+    include_sections = args.get('include_sections', DEFAULT_REPORT_SECTIONS)
+    threat_count = len(threat_model) if isinstance(threat_model, list) else 0
+
+    # Assemble the markdown report from the static sections in a single join
+    parts = [REPORT_TITLE]
+    if 'executive_summary' in include_sections:
+        parts.append(REPORT_EXECUTIVE_SUMMARY)
+    parts.append(REPORT_APPLICATION_OVERVIEW)
+    if 'threats' in include_sections:
+        parts.append(REPORT_THREAT_ANALYSIS)
+    if 'risk_scores' in include_sections:
+        parts.append(REPORT_RISK_ASSESSMENT)
+    if 'mitigations' in include_sections:
+        parts.append(REPORT_MITIGATIONS)
+    parts.append(REPORT_CLOSING_HEAD)
+    parts.append(str(threat_count))
+    parts.append(REPORT_CLOSING_TAIL)
+
+    return "".join(parts)
+
+COVERAGE_FRAMEWORK = {
+    "description": "Systematic validation of STRIDE threat model completeness",
+    "stride_categories": {
+        "S": "Spoofing - Verify all identity-related threats are considered",
+        "T": "Tampering - Verify all data/code integrity threats are considered",
+        "R": "Repudiation - Verify all accountability threats are considered",
+        "I": "Information Disclosure - Verify all confidentiality threats are considered",
+        "D": "Denial of Service - Verify all availability threats are considered",
+        "E": "Elevation of Privilege - Verify all authorization threats are considered"
+    },
+    "validation_criteria": {
+        "completeness": "All STRIDE categories addressed for each trust boundary",
+        "specificity": "Threats are specific to the application context",
+        "actionability": "Threats lead to implementable mitigations",
+        "risk_alignment": "High-risk threats receive appropriate attention"
+    },
+    "common_gaps": {
+        "trust_boundaries": "Missing threats at component interfaces",
+        "data_flows": "Insufficient consideration of data in transit",
+        "privileged_operations": "Inadequate coverage of admin functions",
+        "error_conditions": "Missing threat consideration for edge cases"
+    }
+}
+
+COVERAGE_ANALYSIS_GUIDANCE = "Review the threat model against this framework to identify coverage gaps. Ensure each STRIDE category is adequately represented for all trust boundaries and data flows."
+
+def validate_threat_coverage(args: dict[str, object]) -> dict[str, object]:
+    """Provide coverage validation framework for LLM client analysis."""
+    threat_model = args.get('threat_model', [])
+    app_context = args.get('app_context', {})
 
     return {
-        "coverage_framework": {
-            "description": "Systematic validation of STRIDE threat model completeness",
-            "stride_categories": {
-                "S": "Spoofing - Verify all identity-related threats are considered",
-                "T": "Tampering - Verify all data/code integrity threats are considered",
-                "R": "Repudiation - Verify all accountability threats are considered",
-                "I": "Information Disclosure - Verify all confidentiality threats are considered",
-                "D": "Denial of Service - Verify all availability threats are considered",
-                "E": "Elevation of Privilege - Verify all authorization threats are considered"
-            },
-            "validation_criteria": {
-                "completeness": "All STRIDE categories addressed for each trust boundary",
-                "specificity": "Threats are specific to the application context",
-                "actionability": "Threats lead to implementable mitigations",
-                "risk_alignment": "High-risk threats receive appropriate attention"
-            },
-            "common_gaps": {
-                "trust_boundaries": "Missing threats at component interfaces",
-                "data_flows": "Insufficient consideration of data in transit",
-                "privileged_operations": "Inadequate coverage of admin functions",
-                "error_conditions": "Missing threat consideration for edge cases"
-            }
-        },
+        "coverage_framework": COVERAGE_FRAMEWORK,
         "threat_model": threat_model,
         "app_context": app_context,
-        "analysis_guidance": "Review the threat model against this framework to identify coverage gaps. Ensure each STRIDE category is adequately represented for all trust boundaries and data flows."
+        "analysis_guidance": COVERAGE_ANALYSIS_GUIDANCE
     }
 
-def get_repository_analysis_guide(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Provide structured framework for extracting threat modeling inputs from repository analysis."""
-    analysis_stage = args.get('analysis_stage', 'initial')
-    repo_context = args.get('repository_context', {})
-
-    # Common framework returned for all stages
-    base_framework = {
-        "analysis_framework": {
-            "description": "Structured approach to repository analysis for threat modeling",
-            "stages": {
-                "initial": {
-                    "objective": "Quick scan to understand tech stack, architecture, and deployment model",
-                    "target_files": "3-5 key files",
-                    "focus": "High-level only",
-                    "output": "Tech stack, deployment model, basic architecture"
-                },
-                "deep_dive": {
-                    "objective": "Extract detailed security context for threat modeling",
-                    "target_files": "8-12 targeted files/searches",
-                    "focus": "Security-critical components only",
-                    "output": "Trust boundaries, sensitive data, access controls"
-                },
-                "validation": {
-                    "objective": "Verify sufficient context for threat modeling",
-                    "target_files": "Review completeness",
-                    "output": "Readiness assessment or identified gaps"
-                }
+# Repository analysis guide content; each stage maps to the sections it adds
+# after the common base, plus its guidance text and next steps
+REPOSITORY_ANALYSIS_BASE = {
+    "analysis_framework": {
+        "description": "Structured approach to repository analysis for threat modeling",
+        "stages": {
+            "initial": {
+                "objective": "Quick scan to understand tech stack, architecture, and deployment model",
+                "target_files": "3-5 key files",
+                "focus": "High-level only",
+                "output": "Tech stack, deployment model, basic architecture"
+            },
+            "deep_dive": {
+                "objective": "Extract detailed security context for threat modeling",
+                "target_files": "8-12 targeted files/searches",
+                "focus": "Security-critical components only",
+                "output": "Trust boundaries, sensitive data, access controls"
+            },
+            "validation": {
+                "objective": "Verify sufficient context for threat modeling",
+                "target_files": "Review completeness",
+                "output": "Readiness assessment or identified gaps"
             }
+        }
+    },
+    "context_management": {
+        "description": "Efficient analysis principles to preserve context for threat modeling",
+        "optimization_principles": [
+            "When in doubt, search instead of read",
+            "STOP after 3-5 file reads in initial stage - assess readiness",
+            "STOP after 8-12 searches/reads in deep_dive - assess readiness",
+            "Don't re-read files - reference previous reads by file path",
+            "Search returns snippets; full reads return entire files",
+            "Use file path references in threat descriptions, not code snippets"
+        ],
+        "stopping_checkpoints": {
+            "after_initial": "After 3-5 file reads, STOP and ask: Can I identify app type, tech stack, deployment model? If yes, proceed to deep_dive. If no, read 1-2 more specific files.",
+            "after_deep_dive": "After 8-12 searches/reads, STOP and ask: Can I populate the output_template fields? If yes, start threat modeling. If no, search for specific missing info only.",
+            "principle": "Don't read for completeness - read until you have enough. More files = wasted context."
         },
-        "context_management": {
-            "description": "Efficient analysis principles to preserve context for threat modeling",
-            "optimization_principles": [
-                "When in doubt, search instead of read",
-                "STOP after 3-5 file reads in initial stage - assess readiness",
-                "STOP after 8-12 searches/reads in deep_dive - assess readiness",
-                "Don't re-read files - reference previous reads by file path",
-                "Search returns snippets; full reads return entire files",
-                "Use file path references in threat descriptions, not code snippets"
+        "decision_guidance": {
+            "read_full_file_when": [
+                "You need specific configuration values (.env.example, config files)",
+                "File type is typically small (package.json, docker-compose.yml, README)",
+                "You need the complete architecture overview"
             ],
-            "stopping_checkpoints": {
-                "after_initial": "After 3-5 file reads, STOP and ask: Can I identify app type, tech stack, deployment model? If yes, proceed to deep_dive. If no, read 1-2 more specific files.",
-                "after_deep_dive": "After 8-12 searches/reads, STOP and ask: Can I populate the output_template fields? If yes, start threat modeling. If no, search for specific missing info only.",
-                "principle": "Don't read for completeness - read until you have enough. More files = wasted context."
-            },
-            "decision_guidance": {
-                "read_full_file_when": [
-                    "You need specific configuration values (.env.example, config files)",
-                    "File type is typically small (package.json, docker-compose.yml, README)",
-                    "You need the complete architecture overview"
-                ],
-                "use_search_when": [
-                    "Looking for patterns (authentication methods, authorization checks)",
-                    "Examining application code (controllers, services, middleware)",
-                    "File type is typically large (application logic, route handlers)",
-                    "You need to understand 'how' something works, not specific values"
-                ]
-            }
+            "use_search_when": [
+                "Looking for patterns (authentication methods, authorization checks)",
+                "Examining application code (controllers, services, middleware)",
+                "File type is typically large (application logic, route handlers)",
+                "You need to understand 'how' something works, not specific values"
+            ]
         }
     }
+}
+
+REPOSITORY_READING_STRATEGY = {
+    "description": "File reading strategy based on information value and typical file sizes",
+    "read_these_files": {
+        "priority": "Read first - typically small with high information density",
+        "files": [
+            "README.md - architecture overview",
+            "package.json / requirements.txt / pom.xml - tech stack identification",
+            "docker-compose.yml / Dockerfile - deployment model",
+            ".env.example - integrations and required services"
+        ],
+        "characteristics": "Config and documentation files are usually small, contain specific values needed for threat modeling",
+        "method": "Use mcp__github__get_file_contents"
+    },
+    "search_instead_of_read": {
+        "priority": "Use code search to extract relevant snippets - avoid full reads",
+        "patterns": [
+            "OpenAPI/Swagger specs - search for endpoint definitions",
+            "Auth middleware - search for 'authenticate' OR 'jwt.verify' patterns",
+            "Database models - search for 'model' OR 'schema' patterns",
+            "Controllers/routes - search for specific endpoints or patterns"
+        ],
+        "characteristics": "Application code files are typically large; search gives you relevant snippets without full file content",
+        "method": "Use mcp__github__search_code with targeted queries"
+    },
+    "avoid_or_skip": {
+        "priority": "Never read these fully - always use search or skip entirely",
+        "files": [
+            "Application code files (controllers, services, handlers) - search instead",
+            "Database migrations - infer schema from models or search",
+            "Test files - usually not needed for threat modeling",
+            "Generated code / build artifacts - not relevant",
+            "Large documentation files - search for specific sections if needed"
+        ],
+        "alternative": "Use mcp__github__search_code with specific keywords"
+    }
+}
 
-    # Stage-specific guidance
-    if analysis_stage == "initial":
-        base_framework["prioritized_reading_strategy"] = {
-            "description": "File reading strategy based on information value and typical file sizes",
-            "read_these_files": {
-                "priority": "Read first - typically small with high information density",
-                "files": [
-                    "README.md - architecture overview",
-                    "package.json / requirements.txt / pom.xml - tech stack identification",
-                    "docker-compose.yml / Dockerfile - deployment model",
-                    ".env.example - integrations and required services"
-                ],
-                "characteristics": "Config and documentation files are usually small, contain specific values needed for threat modeling",
-                "method": "Use mcp__github__get_file_contents"
+REPOSITORY_INITIAL_RECONNAISSANCE = {
+    "files_to_examine_first": {
+        "documentation": ["README.md", "ARCHITECTURE.md", "docs/architecture.*", "docs/design.*"],
+        "package_managers": ["package.json", "requirements.txt", "pom.xml", "Cargo.toml", "go.mod", "Gemfile", "composer.json"],
+        "containerization": ["docker-compose.yml", "Dockerfile", "docker-compose.yaml", ".dockerignore"],
+        "configuration": [".env.example", "config/", "*.config.js", "*.config.ts", "application.yml", "appsettings.json"],
+        "infrastructure": ["terraform/", "*.tf", "cloudformation/", "*.yaml", "kubernetes/", "k8s/", ".github/workflows/", ".gitlab-ci.yml"],
+        "api_specs": ["openapi.yaml", "swagger.json", "schema.graphql", "*.proto"]
+    },
+    "extraction_patterns": {
+        "authentication_mechanisms": {
+            "JWT": ["jsonwebtoken", "pyjwt", "jose", "jwt-decode", "auth0"],
+            "OAuth_2.0": ["passport", "passport-oauth2", "authlib", "spring-security-oauth2", "oauth2client"],
+            "Session-based": ["express-session", "django.contrib.sessions", "flask-session", "rack-session"],
+            "API_Keys": ["API key validation patterns in code", "x-api-key headers"],
+            "SAML_SSO": ["saml2", "passport-saml", "ruby-saml"],
+            "Multi-factor": ["speakeasy", "pyotp", "authy", "totp"]
+        },
+        "deployment_model": {
+            "Containerized_microservices": ["Dockerfile AND kubernetes/", "docker-compose with multiple services"],
+            "Serverless_functions": ["serverless.yml", "sam-template.yaml", "netlify.toml", "vercel.json with functions"],
+            "Multi-container_application": ["docker-compose.yml with multiple services"],
+            "Client-side_SPA": ["Static hosting config", "Build output to dist/ or build/"],
+            "Traditional_server": ["Server configuration files", "No containerization"]
+        },
+        "technology_stack": {
+            "Frontend": {
+                "React": ["react", "react-dom in dependencies"],
+                "Vue": ["vue in dependencies"],
+                "Angular": ["@angular/core"],
+                "Svelte": ["svelte in dependencies"],
+                "Next.js": ["next in dependencies"]
             },
-            "search_instead_of_read": {
-                "priority": "Use code search to extract relevant snippets - avoid full reads",
-                "patterns": [
-                    "OpenAPI/Swagger specs - search for endpoint definitions",
-                    "Auth middleware - search for 'authenticate' OR 'jwt.verify' patterns",
-                    "Database models - search for 'model' OR 'schema' patterns",
-                    "Controllers/routes - search for specific endpoints or patterns"
-                ],
-                "characteristics": "Application code files are typically large; search gives you relevant snippets without full file content",
-                "method": "Use mcp__github__search_code with targeted queries"
+            "Backend": {
+                "Express": ["express in dependencies"],
+                "FastAPI": ["fastapi in requirements"],
+                "Django": ["django in requirements"],
+                "Spring_Boot": ["spring-boot in pom.xml/gradle"],
+                "Rails": ["rails in Gemfile"],
+                "Flask": ["flask in requirements"]
             },
-            "avoid_or_skip": {
-                "priority": "Never read these fully - always use search or skip entirely",
-                "files": [
-                    "Application code files (controllers, services, handlers) - search instead",
-                    "Database migrations - infer schema from models or search",
-                    "Test files - usually not needed for threat modeling",
-                    "Generated code / build artifacts - not relevant",
-                    "Large documentation files - search for specific sections if needed"
-                ],
-                "alternative": "Use mcp__github__search_code with specific keywords"
-            }
-        }
-
-        base_framework["initial_reconnaissance"] = {
-            "files_to_examine_first": {
-                "documentation": ["README.md", "ARCHITECTURE.md", "docs/architecture.*", "docs/design.*"],
-                "package_managers": ["package.json", "requirements.txt", "pom.xml", "Cargo.toml", "go.mod", "Gemfile", "composer.json"],
-                "containerization": ["docker-compose.yml", "Dockerfile", "docker-compose.yaml", ".dockerignore"],
-                "configuration": [".env.example", "config/", "*.config.js", "*.config.ts", "application.yml", "appsettings.json"],
-                "infrastructure": ["terraform/", "*.tf", "cloudformation/", "*.yaml", "kubernetes/", "k8s/", ".github/workflows/", ".gitlab-ci.yml"],
-                "api_specs": ["openapi.yaml", "swagger.json", "schema.graphql", "*.proto"]
+            "Database": {
+                "PostgreSQL": ["pg", "psycopg2", "postgresql"],
+                "MongoDB": ["mongodb", "mongoose", "pymongo"],
+                "MySQL": ["mysql", "mysql2", "mysqlclient"],
+                "Redis": ["redis", "ioredis"],
+                "DynamoDB": ["aws-sdk dynamodb", "boto3 dynamodb"]
             },
-            "extraction_patterns": {
-                "authentication_mechanisms": {
-                    "JWT": ["jsonwebtoken", "pyjwt", "jose", "jwt-decode", "auth0"],
-                    "OAuth_2.0": ["passport", "passport-oauth2", "authlib", "spring-security-oauth2", "oauth2client"],
-                    "Session-based": ["express-session", "django.contrib.sessions", "flask-session", "rack-session"],
-                    "API_Keys": ["API key validation patterns in code", "x-api-key headers"],
-                    "SAML_SSO": ["saml2", "passport-saml", "ruby-saml"],
-                    "Multi-factor": ["speakeasy", "pyotp", "authy", "totp"]
-                },
-                "deployment_model": {
-                    "Containerized_microservices": ["Dockerfile AND kubernetes/", "docker-compose with multiple services"],
-                    "Serverless_functions": ["serverless.yml", "sam-template.yaml", "netlify.toml", "vercel.json with functions"],
-                    "Multi-container_application": ["docker-compose.yml with multiple services"],
-                    "Client-side_SPA": ["Static hosting config", "Build output to dist/ or build/"],
-                    "Traditional_server": ["Server configuration files", "No containerization"]
-                },
-                "technology_stack": {
-                    "Frontend": {
-                        "React": ["react", "react-dom in dependencies"],
-                        "Vue": ["vue in dependencies"],
-                        "Angular": ["@angular/core"],
-                        "Svelte": ["svelte in dependencies"],
-                        "Next.js": ["next in dependencies"]
-                    },
-                    "Backend": {
-                        "Express": ["express in dependencies"],
-                        "FastAPI": ["fastapi in requirements"],
-                        "Django": ["django in requirements"],
-                        "Spring_Boot": ["spring-boot in pom.xml/gradle"],
-                        "Rails": ["rails in Gemfile"],
-                        "Flask": ["flask in requirements"]
-                    },
-                    "Database": {
-                        "PostgreSQL": ["pg", "psycopg2", "postgresql"],
-                        "MongoDB": ["mongodb", "mongoose", "pymongo"],
-                        "MySQL": ["mysql", "mysql2", "mysqlclient"],
-                        "Redis": ["redis", "ioredis"],
-                        "DynamoDB": ["aws-sdk dynamodb", "boto3 dynamodb"]
-                    },
-                    "Message_Queues": ["rabbitmq", "kafka", "aws-sdk sqs", "celery"],
-                    "Caching": ["redis", "memcached", "node-cache"]
-                }
-            }
+            "Message_Queues": ["rabbitmq", "kafka", "aws-sdk sqs", "celery"],
+            "Caching": ["redis", "memcached", "node-cache"]
         }
+    }
+}
 
-    elif analysis_stage == "deep_dive":
-        primary_lang = repo_context.get('primary_language', '').lower()
-        framework = repo_context.get('framework_detected', '').lower()
-
-        base_framework["deep_dive_analysis"] = {
-            "trust_boundaries": {
-                "external_boundaries": {
-                    "description": "Entry points from untrusted sources",
-                    "locations_to_examine": [
-                        "Public API endpoints (routes, controllers, handlers)",
-                        "Authentication entry points (login, registration, password reset)",
-                        "File upload handlers and multipart form processors",
-                        "Webhook receivers and callback endpoints",
-                        "GraphQL/gRPC/WebSocket endpoints",
-                        "Public-facing web pages and forms"
-                    ]
-                },
-                "internal_boundaries": {
-                    "description": "Trust transitions within the system",
-                    "locations_to_examine": [
-                        "Service-to-service communication (microservices)",
-                        "Database access layers and query builders",
-                        "Admin/privileged functionality and dashboards",
-                        "Background job processors and queues",
-                        "Third-party API integrations and SDKs",
-                        "Shared libraries and common modules"
-                    ]
-                }
-            },
-            "code_patterns_to_analyze": {
-                "sensitive_data_handling": {
-                    "user_models": "Models/schemas with email, password, name, address, phone, SSN",
-                    "payment_processing": "Stripe, PayPal, payment gateway integrations",
-                    "healthcare_data": "HIPAA-related fields, patient records, PHI",
-                    "financial_data": "Transaction models, account balances, trading data",
-                    "credentials_secrets": "API keys, tokens, certificates, encryption keys",
-                    "files_to_check": ["models/", "schemas/", "entities/", "domain/", "database/migrations/"]
-                },
-                "access_control_patterns": {
-                    "middleware_decorators": "@require_auth, @admin_only, @permission_required, authenticate middleware",
-                    "rbac_implementations": "Role and permission models, access control lists",
-                    "row_level_security": "Multi-tenancy, data isolation patterns",
-                    "admin_functionality": "Admin panels, privileged operations",
-                    "files_to_check": ["middleware/", "decorators/", "guards/", "policies/", "permissions/"]
-                },
-                "data_flow_analysis": {
-                    "request_handling": "Request → Validation → Processing → Storage flow",
-                    "user_input": "Form handling, API body parsing, query parameters",
-                    "serialization": "Data transformation, API responses, template rendering",
-                    "logging_audit": "Security event logging, audit trails, activity logs",
-                    "files_to_check": ["routes/", "controllers/", "handlers/", "api/", "views/"]
-                },
-                "external_dependencies": {
-                    "third_party_apis": "Payment, authentication, analytics services",
-                    "cloud_services": "AWS S3, SQS, Lambda, Azure, GCP services",
-                    "cdn_assets": "Static asset hosting, CDN configuration",
-                    "communication": "Email (SendGrid, SES), SMS (Twilio)",
-                    "monitoring": "Sentry, DataDog, New Relic, logging services",
-                    "files_to_check": ["package.json/requirements.txt dependencies", "config/", "services/", "integrations/"]
-                }
-            }
+REPOSITORY_DEEP_DIVE_ANALYSIS = {
+    "trust_boundaries": {
+        "external_boundaries": {
+            "description": "Entry points from untrusted sources",
+            "locations_to_examine": [
+                "Public API endpoints (routes, controllers, handlers)",
+                "Authentication entry points (login, registration, password reset)",
+                "File upload handlers and multipart form processors",
+                "Webhook receivers and callback endpoints",
+                "GraphQL/gRPC/WebSocket endpoints",
+                "Public-facing web pages and forms"
+            ]
+        },
+        "internal_boundaries": {
+            "description": "Trust transitions within the system",
+            "locations_to_examine": [
+                "Service-to-service communication (microservices)",
+                "Database access layers and query builders",
+                "Admin/privileged functionality and dashboards",
+                "Background job processors and queues",
+                "Third-party API integrations and SDKs",
+                "Shared libraries and common modules"
+            ]
         }
-
-        # Add technology-specific guides
-        base_framework["technology_guides"] = {
-            "web_applications": {
-                "applicable_if": "React/Vue/Angular + Node.js/Django/Rails + Database",
-                "key_files": [
-                    "src/routes/ or src/controllers/ - API endpoints and routing",
-                    "src/middleware/auth.* - Authentication and authorization",
-                    "src/models/ or src/schemas/ - Database schemas and sensitive fields",
-                    "src/services/ - Business logic and external integrations",
-                    ".env.example - Configuration template and required secrets"
-                ],
-                "security_focus": [
-                    "API authentication and authorization patterns",
-                    "CORS configuration and origin validation",
-                    "Session management and token handling",
-                    "Input validation and sanitization libraries",
-                    "Database query patterns (prepared statements vs. string concatenation)"
-                ]
-            },
-            "api_services": {
-                "applicable_if": "FastAPI, Express, Django REST, Spring Boot, ASP.NET Core",
-                "key_files": [
-                    "Route/endpoint definitions and handlers",
-                    "Authentication middleware and security filters",
-                    "Input validation schemas (Pydantic, Joi, Bean Validation)",
-                    "Database ORM models and repositories",
-                    "API documentation (OpenAPI/Swagger specs)"
-                ],
-                "security_focus": [
-                    "OAuth 2.0 / JWT implementation and validation",
-                    "Rate limiting and request throttling",
-                    "API versioning and backward compatibility",
-                    "Input validation and type safety",
-                    "Error handling and information disclosure prevention"
-                ]
-            },
-            "cloud_infrastructure": {
-                "applicable_if": "Terraform, CloudFormation, Pulumi, CDK",
-                "key_files": [
-                    "*.tf or *.yaml - Infrastructure definitions",
-                    "IAM roles, policies, and permission boundaries",
-                    "Security groups, NACLs, firewall rules",
-                    "KMS keys and secrets management configuration",
-                    "CI/CD pipeline definitions and deployment workflows"
-                ],
-                "security_focus": [
-                    "IAM least privilege principle",
-                    "Network segmentation and isolation",
-                    "Encryption in transit (TLS) and at rest (KMS)",
-                    "Secrets rotation and management",
-                    "Resource exposure (public vs. private endpoints)"
-                ]
-            },
-            "ai_ml_systems": {
-                "applicable_if": "Python ML stack, LangChain, vector databases, model serving",
-                "key_files": [
-                    "Model serving and inference code",
-                    "Training pipelines and data preprocessing",
-                    "Vector database configurations (Pinecone, Weaviate, ChromaDB)",
-                    "RAG system implementations and prompt templates",
-                    "Agent/tool configurations and permissions"
-                ],
-                "security_focus": [
-                    "Prompt injection and jailbreak vectors",
-                    "Training data provenance and validation",
-                    "Model access controls and API authentication",
-                    "Inference API rate limiting and abuse prevention",
-                    "AI agent boundaries, tool permissions, and autonomy limits"
-                ]
-            },
-            "mobile_applications": {
-                "applicable_if": "React Native, Flutter, iOS/Android native",
-                "key_files": [
-                    "API client and network layer",
-                    "Local storage and keychain/keystore usage",
-                    "Authentication and token management",
-                    "Deep linking and URL scheme handling",
-                    "App permissions and entitlements"
-                ],
-                "security_focus": [
-                    "Certificate pinning and TLS validation",
-                    "Secure local storage (encrypted databases)",
-                    "Token storage in secure enclaves",
-                    "Code obfuscation and reverse engineering protection",
-                    "Platform-specific security features (biometrics, sandboxing)"
-                ]
-            }
+    },
+    "code_patterns_to_analyze": {
+        "sensitive_data_handling": {
+            "user_models": "Models/schemas with email, password, name, address, phone, SSN",
+            "payment_processing": "Stripe, PayPal, payment gateway integrations",
+            "healthcare_data": "HIPAA-related fields, patient records, PHI",
+            "financial_data": "Transaction models, account balances, trading data",
+            "credentials_secrets": "API keys, tokens, certificates, encryption keys",
+            "files_to_check": ["models/", "schemas/", "entities/", "domain/", "database/migrations/"]
+        },
+        "access_control_patterns": {
+            "middleware_decorators": "@require_auth, @admin_only, @permission_required, authenticate middleware",
+            "rbac_implementations": "Role and permission models, access control lists",
+            "row_level_security": "Multi-tenancy, data isolation patterns",
+            "admin_functionality": "Admin panels, privileged operations",
+            "files_to_check": ["middleware/", "decorators/", "guards/", "policies/", "permissions/"]
+        },
+        "data_flow_analysis": {
+            "request_handling": "Request → Validation → Processing → Storage flow",
+            "user_input": "Form handling, API body parsing, query parameters",
+            "serialization": "Data transformation, API responses, template rendering",
+            "logging_audit": "Security event logging, audit trails, activity logs",
+            "files_to_check": ["routes/", "controllers/", "handlers/", "api/", "views/"]
+        },
+        "external_dependencies": {
+            "third_party_apis": "Payment, authentication, analytics services",
+            "cloud_services": "AWS S3, SQS, Lambda, Azure, GCP services",
+            "cdn_assets": "Static asset hosting, CDN configuration",
+            "communication": "Email (SendGrid, SES), SMS (Twilio)",
+            "monitoring": "Sentry, DataDog, New Relic, logging services",
+            "files_to_check": ["package.json/requirements.txt dependencies", "config/", "services/", "integrations/"]
         }
+    }
+}
 
-    elif analysis_stage == "validation":
-        base_framework["validation_checklist"] = {
-            "architecture_understanding": {
-                "application_type": "Web app, API, mobile, infrastructure, AI/ML system identified",
-                "technology_stack": "Primary languages, frameworks, and platforms documented",
-                "deployment_model": "Cloud, on-premise, hybrid, serverless determined",
-                "system_components": "Major components and their interactions mapped"
-            },
-            "security_context": {
-                "authentication_methods": "All auth mechanisms identified (JWT, OAuth, sessions, etc.)",
-                "authorization_approach": "RBAC, ABAC, or custom authorization understood",
-                "sensitive_data_types": "PII, payment data, health data, credentials catalogued",
-                "trust_boundaries": "External and internal boundaries identified",
-                "external_dependencies": "Third-party services and APIs mapped"
-            },
-            "deployment_operations": {
-                "internet_exposure": "Public, private, or hybrid exposure determined",
-                "infrastructure_config": "Cloud resources, networking, security groups analyzed",
-                "cicd_security": "Deployment pipeline and artifact security reviewed",
-                "secrets_management": "How secrets are stored and accessed identified"
-            },
-            "readiness_assessment": {
-                "minimum_requirements": [
-                    "app_description can be written (2-4 sentences)",
-                    "app_type is clear",
-                    "At least one authentication_method identified",
-                    "internet_facing status is known",
-                    "At least one sensitive_data_type identified"
-                ],
-                "quality_indicators": [
-                    "Trust boundaries are clearly understood",
-                    "Data flow patterns have been traced",
-                    "External dependencies are documented",
-                    "Access control patterns are identified"
-                ]
-            }
-        }
+REPOSITORY_TECHNOLOGY_GUIDES = {
+    "web_applications": {
+        "applicable_if": "React/Vue/Angular + Node.js/Django/Rails + Database",
+        "key_files": [
+            "src/routes/ or src/controllers/ - API endpoints and routing",
+            "src/middleware/auth.* - Authentication and authorization",
+            "src/models/ or src/schemas/ - Database schemas and sensitive fields",
+            "src/services/ - Business logic and external integrations",
+            ".env.example - Configuration template and required secrets"
+        ],
+        "security_focus": [
+            "API authentication and authorization patterns",
+            "CORS configuration and origin validation",
+            "Session management and token handling",
+            "Input validation and sanitization libraries",
+            "Database query patterns (prepared statements vs. string concatenation)"
+        ]
+    },
+    "api_services": {
+        "applicable_if": "FastAPI, Express, Django REST, Spring Boot, ASP.NET Core",
+        "key_files": [
+            "Route/endpoint definitions and handlers",
+            "Authentication middleware and security filters",
+            "Input validation schemas (Pydantic, Joi, Bean Validation)",
+            "Database ORM models and repositories",
+            "API documentation (OpenAPI/Swagger specs)"
+        ],
+        "security_focus": [
+            "OAuth 2.0 / JWT implementation and validation",
+            "Rate limiting and request throttling",
+            "API versioning and backward compatibility",
+            "Input validation and type safety",
+            "Error handling and information disclosure prevention"
+        ]
+    },
+    "cloud_infrastructure": {
+        "applicable_if": "Terraform, CloudFormation, Pulumi, CDK",
+        "key_files": [
+            "*.tf or *.yaml - Infrastructure definitions",
+            "IAM roles, policies, and permission boundaries",
+            "Security groups, NACLs, firewall rules",
+            "KMS keys and secrets management configuration",
+            "CI/CD pipeline definitions and deployment workflows"
+        ],
+        "security_focus": [
+            "IAM least privilege principle",
+            "Network segmentation and isolation",
+            "Encryption in transit (TLS) and at rest (KMS)",
+            "Secrets rotation and management",
+            "Resource exposure (public vs. private endpoints)"
+        ]
+    },
+    "ai_ml_systems": {
+        "applicable_if": "Python ML stack, LangChain, vector databases, model serving",
+        "key_files": [
+            "Model serving and inference code",
+            "Training pipelines and data preprocessing",
+            "Vector database configurations (Pinecone, Weaviate, ChromaDB)",
+            "RAG system implementations and prompt templates",
+            "Agent/tool configurations and permissions"
+        ],
+        "security_focus": [
+            "Prompt injection and jailbreak vectors",
+            "Training data provenance and validation",
+            "Model access controls and API authentication",
+            "Inference API rate limiting and abuse prevention",
+            "AI agent boundaries, tool permissions, and autonomy limits"
+        ]
+    },
+    "mobile_applications": {
+        "applicable_if": "React Native, Flutter, iOS/Android native",
+        "key_files": [
+            "API client and network layer",
+            "Local storage and keychain/keystore usage",
+            "Authentication and token management",
+            "Deep linking and URL scheme handling",
+            "App permissions and entitlements"
+        ],
+        "security_focus": [
+            "Certificate pinning and TLS validation",
+            "Secure local storage (encrypted databases)",
+            "Token storage in secure enclaves",
+            "Code obfuscation and reverse engineering protection",
+            "Platform-specific security features (biometrics, sandboxing)"
+        ]
+    }
+}
 
-    # Output template - always included
-    base_framework["output_template"] = {
-        "description": "Structured format for calling get_stride_threat_framework",
-        "threat_modeling_input": {
-            "app_description": {
-                "template": "[App Type] with [Key Components]. Uses [Frontend Tech] frontend, [Backend Tech] backend, [Database Tech] for persistence. Handles [Key Functionality]. Deployed as [Deployment Model]. Integrates with [External Services].",
-                "example": "E-commerce web application with product catalog, shopping cart, and checkout. Uses React frontend, Node.js/Express backend, PostgreSQL for persistence. Handles payment processing via Stripe. Deployed as Docker containers on AWS ECS. Integrates with SendGrid for emails and S3 for product images.",
-                "extraction_guidance": "Synthesize repository analysis into a concise architectural description (2-4 sentences) focusing on components, data flows, and external dependencies."
-            },
-            "app_type": {
-                "valid_values": ["Web Application", "API Service", "Mobile Application", "Cloud Infrastructure", "AI/ML System", "IoT System"],
-                "extraction_guidance": "Choose the primary application category based on repository structure and purpose."
-            },
-            "authentication_methods": {
-                "common_patterns": {
-                    "JWT": ["jsonwebtoken", "pyjwt", "jose libraries"],
-                    "OAuth 2.0": ["passport", "authlib", "spring-security-oauth2"],
-                    "Session-based": ["express-session", "django.contrib.sessions"],
-                    "API Keys": ["API key validation in headers/query params"],
-                    "Multi-factor": ["speakeasy", "pyotp", "authy"],
-                    "None/Public": ["No authentication found - public API or static site"]
-                },
-                "extraction_guidance": "Identify ALL authentication mechanisms by analyzing auth middleware, security configuration, and dependency usage. Provide as an array."
+REPOSITORY_VALIDATION_CHECKLIST = {
+    "architecture_understanding": {
+        "application_type": "Web app, API, mobile, infrastructure, AI/ML system identified",
+        "technology_stack": "Primary languages, frameworks, and platforms documented",
+        "deployment_model": "Cloud, on-premise, hybrid, serverless determined",
+        "system_components": "Major components and their interactions mapped"
+    },
+    "security_context": {
+        "authentication_methods": "All auth mechanisms identified (JWT, OAuth, sessions, etc.)",
+        "authorization_approach": "RBAC, ABAC, or custom authorization understood",
+        "sensitive_data_types": "PII, payment data, health data, credentials catalogued",
+        "trust_boundaries": "External and internal boundaries identified",
+        "external_dependencies": "Third-party services and APIs mapped"
+    },
+    "deployment_operations": {
+        "internet_exposure": "Public, private, or hybrid exposure determined",
+        "infrastructure_config": "Cloud resources, networking, security groups analyzed",
+        "cicd_security": "Deployment pipeline and artifact security reviewed",
+        "secrets_management": "How secrets are stored and accessed identified"
+    },
+    "readiness_assessment": {
+        "minimum_requirements": [
+            "app_description can be written (2-4 sentences)",
+            "app_type is clear",
+            "At least one authentication_method identified",
+            "internet_facing status is known",
+            "At least one sensitive_data_type identified"
+        ],
+        "quality_indicators": [
+            "Trust boundaries are clearly understood",
+            "Data flow patterns have been traced",
+            "External dependencies are documented",
+            "Access control patterns are identified"
+        ]
+    }
+}
+
+REPOSITORY_OUTPUT_TEMPLATE = {
+    "description": "Structured format for calling get_stride_threat_framework",
+    "threat_modeling_input": {
+        "app_description": {
+            "template": "[App Type] with [Key Components]. Uses [Frontend Tech] frontend, [Backend Tech] backend, [Database Tech] for persistence. Handles [Key Functionality]. Deployed as [Deployment Model]. Integrates with [External Services].",
+            "example": "E-commerce web application with product catalog, shopping cart, and checkout. Uses React frontend, Node.js/Express backend, PostgreSQL for persistence. Handles payment processing via Stripe. Deployed as Docker containers on AWS ECS. Integrates with SendGrid for emails and S3 for product images.",
+            "extraction_guidance": "Synthesize repository analysis into a concise architectural description (2-4 sentences) focusing on components, data flows, and external dependencies."
+        },
+        "app_type": {
+            "valid_values": ["Web Application", "API Service", "Mobile Application", "Cloud Infrastructure", "AI/ML System", "IoT System"],
+            "extraction_guidance": "Choose the primary application category based on repository structure and purpose."
+        },
+        "authentication_methods": {
+            "common_patterns": {
+                "JWT": ["jsonwebtoken", "pyjwt", "jose libraries"],
+                "OAuth 2.0": ["passport", "authlib", "spring-security-oauth2"],
+                "Session-based": ["express-session", "django.contrib.sessions"],
+                "API Keys": ["API key validation in headers/query params"],
+                "Multi-factor": ["speakeasy", "pyotp", "authy"],
+                "None/Public": ["No authentication found - public API or static site"]
             },
-            "internet_facing": {
-                "indicators": {
-                    "true": ["Public API endpoints", "Frontend assets", "CDN configuration", "Public load balancers", "Domain/DNS configuration"],
-                    "false": ["VPN requirements", "Private subnets only", "Internal service mesh", "No public ingress", "Localhost only"],
-                    "partial": ["Admin panel behind VPN", "Public API + private admin", "Hybrid architecture"]
-                },
-                "extraction_guidance": "Analyze deployment configuration and network architecture to determine internet exposure. Use boolean true/false."
+            "extraction_guidance": "Identify ALL authentication mechanisms by analyzing auth middleware, security configuration, and dependency usage. Provide as an array."
+        },
+        "internet_facing": {
+            "indicators": {
+                "true": ["Public API endpoints", "Frontend assets", "CDN configuration", "Public load balancers", "Domain/DNS configuration"],
+                "false": ["VPN requirements", "Private subnets only", "Internal service mesh", "No public ingress", "Localhost only"],
+                "partial": ["Admin panel behind VPN", "Public API + private admin", "Hybrid architecture"]
             },
-            "sensitive_data_types": {
-                "detection_patterns": {
-                    "PII": ["User models with email, name, address, phone", "GDPR compliance mentions"],
-                    "Payment Cards": ["Stripe/PayPal integration", "PCI compliance references", "Payment/transaction models"],
-                    "Healthcare Data": ["HIPAA compliance", "Patient/medical record models", "PHI handling"],
-                    "Authentication Credentials": ["Password hashing", "Token storage", "Session data"],
-                    "Financial Data": ["Transaction models", "Account balances", "Trading/investment data"],
-                    "Proprietary Data": ["Trade secrets", "Algorithms", "Business logic", "Source code"]
-                },
-                "extraction_guidance": "Examine data models, API payloads, and compliance documentation to identify ALL sensitive data types. Provide as an array."
-            }
+            "extraction_guidance": "Analyze deployment configuration and network architecture to determine internet exposure. Use boolean true/false."
         },
-        "validation": {
-            "description": "Verify extraction completeness before calling get_stride_threat_framework",
-            "required_fields": ["app_description", "app_type", "authentication_methods", "internet_facing", "sensitive_data_types"],
-            "quality_checks": {
-                "app_description": "Should be 2-4 sentences covering architecture, components, and key functionality",
-                "authentication_methods": "At least one method identified, or explicitly state ['None/Public'] if truly unauthenticated",
-                "sensitive_data_types": "At least one type identified based on data models and functionality, or ['User Data'] as minimum"
-            }
+        "sensitive_data_types": {
+            "detection_patterns": {
+                "PII": ["User models with email, name, address, phone", "GDPR compliance mentions"],
+                "Payment Cards": ["Stripe/PayPal integration", "PCI compliance references", "Payment/transaction models"],
+                "Healthcare Data": ["HIPAA compliance", "Patient/medical record models", "PHI handling"],
+                "Authentication Credentials": ["Password hashing", "Token storage", "Session data"],
+                "Financial Data": ["Transaction models", "Account balances", "Trading/investment data"],
+                "Proprietary Data": ["Trade secrets", "Algorithms", "Business logic", "Source code"]
+            },
+            "extraction_guidance": "Examine data models, API payloads, and compliance documentation to identify ALL sensitive data types. Provide as an array."
+        }
+    },
+    "validation": {
+        "description": "Verify extraction completeness before calling get_stride_threat_framework",
+        "required_fields": ["app_description", "app_type", "authentication_methods", "internet_facing", "sensitive_data_types"],
+        "quality_checks": {
+            "app_description": "Should be 2-4 sentences covering architecture, components, and key functionality",
+            "authentication_methods": "At least one method identified, or explicitly state ['None/Public'] if truly unauthenticated",
+            "sensitive_data_types": "At least one type identified based on data models and functionality, or ['User Data'] as minimum"
         }
     }
+}
 
-    # GitHub MCP integration examples
-    base_framework["github_mcp_integration"] = {
-        "description": "Optimized workflow using GitHub MCP server - prefer search over full file reads",
-        "initial_stage_workflow": {
-            "step_1": {
-                "tool": "mcp__github__get_file_contents",
-                "params_example": '{"owner": "org", "repo": "repo", "path": "README.md"}',
-                "purpose": "Architecture overview",
-                "rationale": "README files contain structured overview; worth reading in full"
-            },
-            "step_2": {
-                "tool": "mcp__github__get_file_contents",
-                "params_example": '{"owner": "org", "repo": "repo", "path": "package.json"}',
-                "purpose": "Tech stack identification",
-                "rationale": "Package manifests are typically small config files"
+REPOSITORY_GITHUB_MCP_INTEGRATION = {
+    "description": "Optimized workflow using GitHub MCP server - prefer search over full file reads",
+    "initial_stage_workflow": {
+        "step_1": {
+            "tool": "mcp__github__get_file_contents",
+            "params_example": '{"owner": "org", "repo": "repo", "path": "README.md"}',
+            "purpose": "Architecture overview",
+            "rationale": "README files contain structured overview; worth reading in full"
+        },
+        "step_2": {
+            "tool": "mcp__github__get_file_contents",
+            "params_example": '{"owner": "org", "repo": "repo", "path": "package.json"}',
+            "purpose": "Tech stack identification",
+            "rationale": "Package manifests are typically small config files"
+        },
+        "step_3": {
+            "tool": "mcp__github__get_file_contents",
+            "params_example": '{"owner": "org", "repo": "repo", "path": "docker-compose.yml"}',
+            "purpose": "Deployment model",
+            "rationale": "Docker configs are small, contain specific deployment info"
+        },
+        "checkpoint": {
+            "action": "STOP - Can you identify: app type, tech stack, deployment model?",
+            "if_yes": "Proceed to deep_dive stage",
+            "if_no": "Read .env.example or one more config file, then proceed"
+        }
+    },
+    "deep_dive_workflow": {
+        "prefer_search_for_patterns": {
+            "authentication": {
+                "tool": "mcp__github__search_code",
+                "query": 'repo:org/repo "passport.authenticate" OR "jwt.verify"',
+                "rationale": "Search returns relevant auth code snippets without full middleware files"
             },
-            "step_3": {
-                "tool": "mcp__github__get_file_contents",
-                "params_example": '{"owner": "org", "repo": "repo", "path": "docker-compose.yml"}',
-                "purpose": "Deployment model",
-                "rationale": "Docker configs are small, contain specific deployment info"
+            "data_models": {
+                "tool": "mcp__github__search_code",
+                "query": 'repo:org/repo path:models/ OR path:schemas/',
+                "rationale": "Search shows model structure without full file content"
             },
-            "checkpoint": {
-                "action": "STOP - Can you identify: app type, tech stack, deployment model?",
-                "if_yes": "Proceed to deep_dive stage",
-                "if_no": "Read .env.example or one more config file, then proceed"
+            "authorization": {
+                "tool": "mcp__github__search_code",
+                "query": 'repo:org/repo "@require" OR "@admin" OR "authorize"',
+                "rationale": "Search finds authorization patterns across codebase"
             }
         },
-        "deep_dive_workflow": {
-            "prefer_search_for_patterns": {
-                "authentication": {
-                    "tool": "mcp__github__search_code",
-                    "query": 'repo:org/repo "passport.authenticate" OR "jwt.verify"',
-                    "rationale": "Search returns relevant auth code snippets without full middleware files"
-                },
-                "data_models": {
-                    "tool": "mcp__github__search_code",
-                    "query": 'repo:org/repo path:models/ OR path:schemas/',
-                    "rationale": "Search shows model structure without full file content"
-                },
-                "authorization": {
-                    "tool": "mcp__github__search_code",
-                    "query": 'repo:org/repo "@require" OR "@admin" OR "authorize"',
-                    "rationale": "Search finds authorization patterns across codebase"
-                }
-            },
-            "read_for_specific_values": {
-                "configuration": {
-                    "tool": "mcp__github__get_file_contents",
-                    "path": ".env.example",
-                    "rationale": "Config files are small and contain specific integration details"
-                }
-            },
-            "checkpoint": {
-                "action": "STOP after 8-12 searches/reads - Can you populate output_template fields?",
-                "if_yes": "Start threat modeling with get_stride_threat_framework",
-                "if_no": "Do 1-2 targeted searches for specific missing info only"
+        "read_for_specific_values": {
+            "configuration": {
+                "tool": "mcp__github__get_file_contents",
+                "path": ".env.example",
+                "rationale": "Config files are small and contain specific integration details"
             }
         },
-        "search_patterns": {
-            "authentication": 'repo:owner/repo "jwt.verify" OR "passport.authenticate" OR "auth.check"',
-            "authorization": 'repo:owner/repo "@require" OR "@admin" OR "permission.check" OR "authorize"',
-            "sensitive_data": 'repo:owner/repo path:models/ "password" OR "email" OR "ssn" OR "credit_card"',
-            "input_validation": 'repo:owner/repo "validate(" OR "sanitize(" OR "escape("',
-            "database_queries": 'repo:owner/repo "query(" OR "execute(" OR "SELECT" OR "INSERT"',
-            "api_endpoints": 'repo:owner/repo "app.get" OR "app.post" OR "@route" OR "@endpoint"'
+        "checkpoint": {
+            "action": "STOP after 8-12 searches/reads - Can you populate output_template fields?",
+            "if_yes": "Start threat modeling with get_stride_threat_framework",
+            "if_no": "Do 1-2 targeted searches for specific missing info only"
         }
+    },
+    "search_patterns": {
+        "authentication": 'repo:owner/repo "jwt.verify" OR "passport.authenticate" OR "auth.check"',
+        "authorization": 'repo:owner/repo "@require" OR "@admin" OR "permission.check" OR "authorize"',
+        "sensitive_data": 'repo:owner/repo path:models/ "password" OR "email" OR "ssn" OR "credit_card"',
+        "input_validation": 'repo:owner/repo "validate(" OR "sanitize(" OR "escape("',
+        "database_queries": 'repo:owner/repo "query(" OR "execute(" OR "SELECT" OR "INSERT"',
+        "api_endpoints": 'repo:owner/repo "app.get" OR "app.post" OR "@route" OR "@endpoint"'
     }
+}
 
-    # Stage-specific analysis guidance
-    if analysis_stage == "initial":
-        guidance = """INITIAL RECONNAISSANCE STAGE:
+REPOSITORY_INITIAL_GUIDANCE = """INITIAL RECONNAISSANCE STAGE:
 
 1. Read 3-5 small, high-value files (README, package.json/requirements.txt, docker-compose.yml)
 2. STOP after 3-5 file reads - assess readiness to proceed
@@ -1365,29 +1582,28 @@ Stopping Checkpoint: After 3-5 files, ask yourself:
 If YES → Proceed to deep_dive stage
 If NO → Read 1-2 more specific files, then proceed anyway"""
 
-        base_framework["next_steps"] = {
-            "after_initial_analysis": [
-                "STOP after 3-5 file reads",
-                "If you have: app type, tech stack, deployment model",
-                "→ Proceed to analysis_stage='deep_dive'",
-                "",
-                "If missing critical info:",
-                "→ Read 1-2 more targeted files, then proceed to deep_dive"
-            ],
-            "stopping_checkpoint": [
-                "After 3-5 file reads, STOP and assess",
-                "Don't read more files for completeness",
-                "Move to deep_dive even if some details are unclear"
-            ],
-            "github_mcp_tips": [
-                "Use mcp__github__get_file_contents for README.md, package.json/requirements.txt, docker-compose.yml",
-                "Config and documentation files are typically small; safe to read in full",
-                "STOP after 3-5 files - don't keep reading"
-            ]
-        }
+REPOSITORY_INITIAL_NEXT_STEPS = {
+    "after_initial_analysis": [
+        "STOP after 3-5 file reads",
+        "If you have: app type, tech stack, deployment model",
+        "→ Proceed to analysis_stage='deep_dive'",
+        "",
+        "If missing critical info:",
+        "→ Read 1-2 more targeted files, then proceed to deep_dive"
+    ],
+    "stopping_checkpoint": [
+        "After 3-5 file reads, STOP and assess",
+        "Don't read more files for completeness",
+        "Move to deep_dive even if some details are unclear"
+    ],
+    "github_mcp_tips": [
+        "Use mcp__github__get_file_contents for README.md, package.json/requirements.txt, docker-compose.yml",
+        "Config and documentation files are typically small; safe to read in full",
+        "STOP after 3-5 files - don't keep reading"
+    ]
+}
 
-    elif analysis_stage == "deep_dive":
-        guidance = """DEEP DIVE ANALYSIS STAGE:
+REPOSITORY_DEEP_DIVE_GUIDANCE = """DEEP DIVE ANALYSIS STAGE:
 
 1. Use code SEARCH (not file reads) to find security patterns:
    - Search for authentication patterns (jwt.verify, passport.authenticate)
@@ -1407,30 +1623,29 @@ Stopping Checkpoint: After 8-12 searches/reads, ask yourself:
 If YES → Proceed to validation stage
 If NO → Do 1-2 targeted searches for specific missing info, then proceed anyway"""
 
-        base_framework["next_steps"] = {
-            "after_deep_dive": [
-                "STOP after 8-12 searches/reads",
-                "If you can populate output_template fields:",
-                "→ Proceed to analysis_stage='validation'",
-                "",
-                "If missing specific details:",
-                "→ Do 1-2 targeted searches, then proceed to validation"
-            ],
-            "stopping_checkpoint": [
-                "After 8-12 searches/reads, STOP and assess",
-                "Don't search for completeness - search until you have enough",
-                "Move to validation even if some details are unclear"
-            ],
-            "github_mcp_tips": [
-                "PREFER mcp__github__search_code over mcp__github__get_file_contents",
-                "Search examples: 'repo:org/repo \"jwt.verify\" OR \"passport.authenticate\"'",
-                "Search returns relevant snippets; full reads return entire files",
-                "Only read full files for config/documentation; search application code"
-            ]
-        }
+REPOSITORY_DEEP_DIVE_NEXT_STEPS = {
+    "after_deep_dive": [
+        "STOP after 8-12 searches/reads",
+        "If you can populate output_template fields:",
+        "→ Proceed to analysis_stage='validation'",
+        "",
+        "If missing specific details:",
+        "→ Do 1-2 targeted searches, then proceed to validation"
+    ],
+    "stopping_checkpoint": [
+        "After 8-12 searches/reads, STOP and assess",
+        "Don't search for completeness - search until you have enough",
+        "Move to validation even if some details are unclear"
+    ],
+    "github_mcp_tips": [
+        "PREFER mcp__github__search_code over mcp__github__get_file_contents",
+        "Search examples: 'repo:org/repo \"jwt.verify\" OR \"passport.authenticate\"'",
+        "Search returns relevant snippets; full reads return entire files",
+        "Only read full files for config/documentation; search application code"
+    ]
+}
 
-    elif analysis_stage == "validation":
-        guidance = """VALIDATION STAGE:
+REPOSITORY_VALIDATION_GUIDANCE = """VALIDATION STAGE:
 
 Check if you can populate the minimum required fields for threat modeling:
 - app_description (2-4 sentences)
@@ -1444,461 +1659,418 @@ If NO → Do 1-2 targeted searches for missing info, then start threat modeling
 
 Don't aim for perfect information - aim for sufficient information to identify threats."""
 
-        base_framework["next_steps"] = {
-            "if_validation_passes": [
-                "1. Format your findings using the output_template",
-                "2. Call get_stride_threat_framework with extracted data",
-                "3. Begin STRIDE threat identification"
-            ],
-            "if_validation_fails": [
-                "1. Identify 1-2 specific missing pieces",
-                "2. Do targeted searches for those specific items only",
-                "3. Proceed to threat modeling even if gaps remain"
-            ],
-            "minimum_required_for_stride": [
-                "app_description (2-4 sentences)",
-                "app_type (e.g., Web Application, API Service)",
-                "authentication_methods (at least one, or 'None/Public')",
-                "internet_facing (true/false)",
-                "sensitive_data_types (at least one, or 'User Data' as default)"
-            ]
-        }
-
-    else:
-        guidance = "Unknown analysis stage. Valid stages: 'initial', 'deep_dive', 'validation'"
+REPOSITORY_VALIDATION_NEXT_STEPS = {
+    "if_validation_passes": [
+        "1. Format your findings using the output_template",
+        "2. Call get_stride_threat_framework with extracted data",
+        "3. Begin STRIDE threat identification"
+    ],
+    "if_validation_fails": [
+        "1. Identify 1-2 specific missing pieces",
+        "2. Do targeted searches for those specific items only",
+        "3. Proceed to threat modeling even if gaps remain"
+    ],
+    "minimum_required_for_stride": [
+        "app_description (2-4 sentences)",
+        "app_type (e.g., Web Application, API Service)",
+        "authentication_methods (at least one, or 'None/Public')",
+        "internet_facing (true/false)",
+        "sensitive_data_types (at least one, or 'User Data' as default)"
+    ]
+}
 
-    base_framework["analysis_guidance"] = guidance
-    base_framework["current_stage"] = analysis_stage
-    base_framework["repository_context"] = repo_context
+REPOSITORY_ANALYSIS_STAGES = {
+    "initial": {
+        "sections": {
+            "prioritized_reading_strategy": REPOSITORY_READING_STRATEGY,
+            "initial_reconnaissance": REPOSITORY_INITIAL_RECONNAISSANCE
+        },
+        "guidance": REPOSITORY_INITIAL_GUIDANCE,
+        "next_steps": REPOSITORY_INITIAL_NEXT_STEPS
+    },
+    "deep_dive": {
+        "sections": {
+            "deep_dive_analysis": REPOSITORY_DEEP_DIVE_ANALYSIS,
+            "technology_guides": REPOSITORY_TECHNOLOGY_GUIDES
+        },
+        "guidance": REPOSITORY_DEEP_DIVE_GUIDANCE,
+        "next_steps": REPOSITORY_DEEP_DIVE_NEXT_STEPS
+    },
+    "validation": {
+        "sections": {
+            "validation_checklist": REPOSITORY_VALIDATION_CHECKLIST
+        },
+        "guidance": REPOSITORY_VALIDATION_GUIDANCE,
+        "next_steps": REPOSITORY_VALIDATION_NEXT_STEPS
+    }
+}
 
-    return base_framework
+REPOSITORY_UNKNOWN_STAGE_GUIDANCE = "Unknown analysis stage. Valid stages: 'initial', 'deep_dive', 'validation'"
 
-def handle_mcp_request(body: dict) -> dict:
-    """Handle MCP JSON-RPC requests using the improved MCP server"""
-    
-    method = body.get('method')
-    params = body.get('params', {})
-    request_id = body.get('id')
-    
-    
-    # Handle initialize
-    if method == 'initialize':
-        return {
-            "jsonrpc": "2.0",
-            "result": {
-                "protocolVersion": "2025-03-26",
-                "capabilities": {
-                    "tools": {"listChanged": False}
+def get_repository_analysis_guide(args: dict[str, object]) -> dict[str, object]:
+    """Provide structured framework for extracting threat modeling inputs from repository analysis."""
+    analysis_stage = args.get('analysis_stage', 'initial')
+    repo_context = args.get('repository_context', {})
+    stage = REPOSITORY_ANALYSIS_STAGES.get(analysis_stage)
+
+    guide = dict(REPOSITORY_ANALYSIS_BASE)
+    if stage is not None:
+        guide.update(stage["sections"])
+    guide["output_template"] = REPOSITORY_OUTPUT_TEMPLATE
+    guide["github_mcp_integration"] = REPOSITORY_GITHUB_MCP_INTEGRATION
+    if stage is not None:
+        guide["next_steps"] = stage["next_steps"]
+        guide["analysis_guidance"] = stage["guidance"]
+    else:
+        guide["analysis_guidance"] = REPOSITORY_UNKNOWN_STAGE_GUIDANCE
+    guide["current_stage"] = analysis_stage
+    guide["repository_context"] = repo_context
+
+    return guide
+
+# Tool schemas advertised via tools/list; shared across requests and never mutated
+TOOL_DEFINITIONS = [
+    {
+        "name": "get_stride_threat_framework",
+        "description": "Return the STRIDE threat-modelling framework and guidance for your model to enumerate threats against the described system. Provides structure and rubrics; your model does the analysis. In skill-aware clients, the 'stride-threat-modelling' skill is the primary path.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "app_description": {
+                    "type": "string",
+                    "description": "Detailed description of the application architecture and functionality"
+                },
+                "app_type": {
+                    "type": "string", 
+                    "description": "Type of application",
+                    "default": "Web Application"
+                },
+                "authentication_methods": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of authentication methods used",
+                    "default": ["Username/Password"]
                 },
-                "serverInfo": {
-                    "name": "STRIDE GPT MCP Server",
-                    "version": "0.1.0"
+                "internet_facing": {
+                    "type": "boolean",
+                    "description": "Whether the application is accessible from the internet",
+                    "default": True
                 },
-                "instructions": "STRIDE threat modelling framework provider. These tools return methodology, scoring rubrics, and report templates for your own model to populate with real analysis — they do not perform the analysis themselves. If your client supports Agent Skills, the companion 'stride-threat-modelling' skill is the primary, richer path and runs standalone; use these tools when it is not available."
+                "sensitive_data_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Types of sensitive data handled",
+                    "default": ["User Data"]
+                }
             },
-            "id": request_id
+            "required": ["app_description"]
         }
-    
-    # Handle tools/list
-    elif method == 'tools/list':
-        tools = [
-            {
-                "name": "get_stride_threat_framework",
-                "description": "Return the STRIDE threat-modelling framework and guidance for your model to enumerate threats against the described system. Provides structure and rubrics; your model does the analysis. In skill-aware clients, the 'stride-threat-modelling' skill is the primary path.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "app_description": {
-                            "type": "string",
-                            "description": "Detailed description of the application architecture and functionality"
-                        },
-                        "app_type": {
-                            "type": "string", 
-                            "description": "Type of application",
-                            "default": "Web Application"
-                        },
-                        "authentication_methods": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of authentication methods used",
-                            "default": ["Username/Password"]
-                        },
-                        "internet_facing": {
-                            "type": "boolean",
-                            "description": "Whether the application is accessible from the internet",
-                            "default": True
-                        },
-                        "sensitive_data_types": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Types of sensitive data handled",
-                            "default": ["User Data"]
-                        }
+    },
+    {
+        "name": "generate_threat_mitigations",
+        "description": "Return a mitigation-strategy framework (control types, difficulty, prioritisation) to guide your model in proposing specific mitigations for the given threats.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threats": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
                     },
-                    "required": ["app_description"]
+                    "description": "Array of threat objects"
+                },
+                "priority_filter": {
+                    "type": "string",
+                    "description": "Filter by priority",
+                    "default": "all"
                 }
             },
-            {
-                "name": "generate_threat_mitigations",
-                "description": "Return a mitigation-strategy framework (control types, difficulty, prioritisation) to guide your model in proposing specific mitigations for the given threats.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "threats": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Array of threat objects"
-                        },
-                        "priority_filter": {
-                            "type": "string",
-                            "description": "Filter by priority",
-                            "default": "all"
-                        }
+            "required": ["threats"]
+        }
+    },
+    {
+        "name": "create_threat_attack_trees",
+        "description": "Return attack-tree structure and guidance (formats, decomposition method) for your model to build application-wide attack trees from the threat context.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threats": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
                     },
-                    "required": ["threats"]
+                    "description": "Array of threat objects (used for context)"
+                },
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Maximum tree depth",
+                    "default": 3
+                },
+                "output_format": {
+                    "type": "string",
+                    "description": "Output format",
+                    "default": "both"
                 }
             },
-            {
-                "name": "create_threat_attack_trees",
-                "description": "Return attack-tree structure and guidance (formats, decomposition method) for your model to build application-wide attack trees from the threat context.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "threats": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Array of threat objects (used for context)"
-                        },
-                        "max_depth": {
-                            "type": "integer",
-                            "description": "Maximum tree depth",
-                            "default": 3
-                        },
-                        "output_format": {
-                            "type": "string",
-                            "description": "Output format",
-                            "default": "both"
-                        }
+            "required": ["threats"]
+        }
+    },
+    {
+        "name": "calculate_threat_risk_scores",
+        "description": "Return the DREAD scoring rubric and criteria for your model to score and prioritise the given threats by severity. The server supplies the rubric; your model assigns the scores.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threats": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
                     },
-                    "required": ["threats"]
-                }
-            },
-            {
-                "name": "calculate_threat_risk_scores",
-                "description": "Return the DREAD scoring rubric and criteria for your model to score and prioritise the given threats by severity. The server supplies the rubric; your model assigns the scores.",
-                "inputSchema": {
+                    "description": "Array of threat objects"
+                },
+                "scoring_guidance": {
                     "type": "object",
-                    "properties": {
-                        "threats": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Array of threat objects"
-                        },
-                        "scoring_guidance": {
-                            "type": "object",
-                            "additionalProperties": True,
-                            "description": "Optional guidance for scoring adjustments"
-                        }
-                    },
-                    "required": ["threats"]
+                    "additionalProperties": True,
+                    "description": "Optional guidance for scoring adjustments"
                 }
             },
-            {
-                "name": "generate_security_tests",
-                "description": "Return security-test scaffolding and guidance (formats, coverage areas) for your model to write test cases that validate the threats' mitigations.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "threats": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Array of threat objects"
-                        },
-                        "test_type": {
-                            "type": "string",
-                            "description": "Type of tests",
-                            "default": "mixed"
-                        },
-                        "format_type": {
-                            "type": "string",
-                            "description": "Output format",
-                            "default": "gherkin"
-                        }
+            "required": ["threats"]
+        }
+    },
+    {
+        "name": "generate_security_tests",
+        "description": "Return security-test scaffolding and guidance (formats, coverage areas) for your model to write test cases that validate the threats' mitigations.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threats": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
                     },
-                    "required": ["threats"]
+                    "description": "Array of threat objects"
+                },
+                "test_type": {
+                    "type": "string",
+                    "description": "Type of tests",
+                    "default": "mixed"
+                },
+                "format_type": {
+                    "type": "string",
+                    "description": "Output format",
+                    "default": "gherkin"
                 }
             },
-            {
-                "name": "generate_threat_report",
-                "description": "Return a Markdown report template/skeleton for your model to populate with the threat analysis. Provides the section scaffold, not finished content. In skill-aware clients the 'stride-threat-modelling' skill's report-format is the authoritative house style.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "threat_model": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Array of threat objects"
-                        },
-                        "mitigations": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Optional array of mitigation strategies"
-                        },
-                        "dread_scores": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Optional array of DREAD scores"
-                        },
-                        "attack_trees": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Optional array of attack trees"
-                        },
-                        "include_sections": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Sections to include in report",
-                            "default": ["executive_summary", "threats", "mitigations", "risk_scores"]
-                        }
+            "required": ["threats"]
+        }
+    },
+    {
+        "name": "generate_threat_report",
+        "description": "Return a Markdown report template/skeleton for your model to populate with the threat analysis. Provides the section scaffold, not finished content. In skill-aware clients the 'stride-threat-modelling' skill's report-format is the authoritative house style.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threat_model": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
+                    },
+                    "description": "Array of threat objects"
+                },
+                "mitigations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
+                    },
+                    "description": "Optional array of mitigation strategies"
+                },
+                "dread_scores": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
+                    },
+                    "description": "Optional array of DREAD scores"
+                },
+                "attack_trees": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
                     },
-                    "required": ["threat_model"]
+                    "description": "Optional array of attack trees"
+                },
+                "include_sections": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Sections to include in report",
+                    "default": ["executive_summary", "threats", "mitigations", "risk_scores"]
                 }
             },
-            {
-                "name": "validate_threat_coverage",
-                "description": "Validate STRIDE coverage completeness and suggest threat model enhancements",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "threat_model": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "additionalProperties": True
-                            },
-                            "description": "Array of threat objects to validate"
-                        },
-                        "app_context": {
-                            "type": "object",
-                            "additionalProperties": True,
-                            "description": "Application context information"
-                        }
+            "required": ["threat_model"]
+        }
+    },
+    {
+        "name": "validate_threat_coverage",
+        "description": "Validate STRIDE coverage completeness and suggest threat model enhancements",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threat_model": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": True
                     },
-                    "required": ["threat_model", "app_context"]
+                    "description": "Array of threat objects to validate"
+                },
+                "app_context": {
+                    "type": "object",
+                    "additionalProperties": True,
+                    "description": "Application context information"
                 }
             },
-            {
-                "name": "get_repository_analysis_guide",
-                "description": "Get structured framework for extracting threat modeling inputs from repository analysis using GitHub MCP or similar tools",
-                "inputSchema": {
+            "required": ["threat_model", "app_context"]
+        }
+    },
+    {
+        "name": "get_repository_analysis_guide",
+        "description": "Get structured framework for extracting threat modeling inputs from repository analysis using GitHub MCP or similar tools",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "analysis_stage": {
+                    "type": "string",
+                    "description": "Analysis stage: 'initial' (quick scan), 'deep_dive' (detailed security analysis), or 'validation' (readiness check)",
+                    "enum": ["initial", "deep_dive", "validation"],
+                    "default": "initial"
+                },
+                "repository_context": {
                     "type": "object",
+                    "description": "Optional context about the repository",
                     "properties": {
-                        "analysis_stage": {
+                        "primary_language": {
+                            "type": "string",
+                            "description": "Primary programming language detected"
+                        },
+                        "framework_detected": {
                             "type": "string",
-                            "description": "Analysis stage: 'initial' (quick scan), 'deep_dive' (detailed security analysis), or 'validation' (readiness check)",
-                            "enum": ["initial", "deep_dive", "validation"],
-                            "default": "initial"
+                            "description": "Primary framework or platform detected"
                         },
-                        "repository_context": {
-                            "type": "object",
-                            "description": "Optional context about the repository",
-                            "properties": {
-                                "primary_language": {
-                                    "type": "string",
-                                    "description": "Primary programming language detected"
-                                },
-                                "framework_detected": {
-                                    "type": "string",
-                                    "description": "Primary framework or platform detected"
-                                },
-                                "repository_type": {
-                                    "type": "string",
-                                    "description": "Type of repository",
-                                    "enum": ["application", "library", "infrastructure", "unknown"]
-                                }
-                            }
+                        "repository_type": {
+                            "type": "string",
+                            "description": "Type of repository",
+                            "enum": ["application", "library", "infrastructure", "unknown"]
                         }
-                    },
-                    "required": []
+                    }
                 }
-            }
-        ]
+            },
+            "required": []
+        }
+    }
+]
+
+# tools/call dispatch by tool name; keys match the names in TOOL_DEFINITIONS
+TOOL_HANDLERS = {
+    'get_stride_threat_framework': get_stride_threat_framework,
+    'generate_threat_mitigations': generate_threat_mitigations,
+    'calculate_threat_risk_scores': calculate_threat_risk_scores,
+    'create_threat_attack_trees': create_threat_attack_trees,
+    'generate_security_tests': generate_security_tests,
+    'generate_threat_report': generate_threat_report,
+    'validate_threat_coverage': validate_threat_coverage,
+    'get_repository_analysis_guide': get_repository_analysis_guide
+}
+
+# Results for the id-independent discovery methods, built once and shared;
+# each response only wraps them in a fresh envelope carrying the request id
+INITIALIZE_RESULT = {
+    "protocolVersion": "2025-03-26",
+    "capabilities": {
+        "tools": {"listChanged": False}
+    },
+    "serverInfo": {
+        "name": "STRIDE GPT MCP Server",
+        "version": "0.1.0"
+    },
+    "instructions": "STRIDE threat modelling framework provider. These tools return methodology, scoring rubrics, and report templates for your own model to populate with real analysis — they do not perform the analysis themselves. If your client supports Agent Skills, the companion 'stride-threat-modelling' skill is the primary, richer path and runs standalone; use these tools when it is not available."
+}
+TOOLS_LIST_RESULT = {"tools": TOOL_DEFINITIONS}
+
+def dispatch_tool_call(params: object) -> bytes | dict[str, object]:
+    """Run a tools/call request and return its text encoded as a JSON string.
+
+    Shared by handle_mcp_request and the HTTP fast path in response_body. A
+    malformed call, unknown tool or failing tool yields the JSON-RPC error
+    object (code and sanitized message) instead.
+    """
+    if not isinstance(params, dict):
+        return {"code": -32602, "message": "Invalid params: expected an object"}
+
+    tool_name = params.get('name')
+    # Unhashable names (e.g. a list) cannot be dict keys and are simply unknown
+    tool = TOOL_HANDLERS.get(tool_name) if isinstance(tool_name, str) else None
+    if tool is None:
+        return {"code": INVALID_PARAMETER_CODE, "message": f"Unknown tool: {tool_name}"}
+
+    try:
+        return tool_text_json(tool, params.get('arguments', {}))
+    except Exception as e:
+        error_id, sanitized_message = sanitize_error(e, f"Tool execution: {tool_name}")
+        return {"code": TOOL_EXECUTION_FAILED_CODE, "message": sanitized_message}
+
+def handle_mcp_request(body: dict) -> dict:
+    """Handle MCP JSON-RPC requests using the improved MCP server"""
+    
+    method = body.get('method')
+    params = body.get('params', {})
+    request_id = body.get('id')
+    
+    
+    # Handle initialize
+    if method == 'initialize':
+        return {
+            "jsonrpc": "2.0",
+            "result": INITIALIZE_RESULT,
+            "id": request_id
+        }
+    
+    # Handle tools/list
+    elif method == 'tools/list':
         return {
             "jsonrpc": "2.0",
-            "result": {"tools": tools},
+            "result": TOOLS_LIST_RESULT,
             "id": request_id
         }
     
     # Handle tools/call - actual implementation
     elif method == 'tools/call':
-        tool_name = params.get('name')
-        arguments = params.get('arguments', {})
-        
-        try:
-            if tool_name == 'get_stride_threat_framework':
-                result = get_stride_threat_framework(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-            
-            elif tool_name == 'generate_threat_mitigations':
-                result = generate_threat_mitigations(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-            
-            elif tool_name == 'calculate_threat_risk_scores':
-                result = calculate_threat_risk_scores(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-            
-            elif tool_name == 'create_threat_attack_trees':
-                result = create_threat_attack_trees(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-            
-            elif tool_name == 'generate_security_tests':
-                result = generate_security_tests(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-            
-            elif tool_name == 'generate_threat_report':
-                result = generate_threat_report(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": result  # This returns markdown directly
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-            
-            elif tool_name == 'validate_threat_coverage':
-                result = validate_threat_coverage(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-
-            elif tool_name == 'get_repository_analysis_guide':
-                result = get_repository_analysis_guide(arguments)
-                return {
-                    "jsonrpc": "2.0",
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    },
-                    "id": request_id
-                }
-
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": ERROR_CODES['INVALID_PARAMETER'],
-                        "message": f"Unknown tool: {tool_name}"
-                    },
-                    "id": request_id
-                }
-                
-        except Exception as e:
-            error_id, sanitized_message = sanitize_error(e, f"Tool execution: {tool_name}")
+        outcome = dispatch_tool_call(params)
+        if isinstance(outcome, dict):
             return {
                 "jsonrpc": "2.0",
-                "error": {
-                    "code": ERROR_CODES['TOOL_EXECUTION_FAILED'],
-                    "message": sanitized_message
-                },
+                "error": outcome,
                 "id": request_id
             }
+
+        return {
+            "jsonrpc": "2.0",
+            "result": {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": json_loads(outcome)
+                    }
+                ]
+            },
+            "id": request_id
+        }
     
     else:
         return {
@@ -1911,119 +2083,497 @@ def handle_mcp_request(body: dict) -> dict:
         }
 
 
+# HTTP/1.1 keeps connections alive between MCP calls; every response carries
+# an explicit Content-Length so the client knows where each body ends
+PROTOCOL_VERSION = 'HTTP/1.1'
+
+# Seconds an idle keep-alive connection may hold a worker before it is closed
+IDLE_CONNECTION_TIMEOUT = 30
+
+# Accepted connections allowed to wait for a pool worker; further connections
+# are refused with a 503 instead of holding sockets open in an unbounded queue
+MAX_QUEUED_CONNECTIONS = 64
+
+# Per-request access log lines cost a timestamp format and a stderr write on
+# every response; opt in with ACCESS_LOG=1. Errors are always logged
+ACCESS_LOG = os.environ.get('ACCESS_LOG') == '1'
+
+# Headers shared by every response, prebuilt so each response is a single write
+SECURITY_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"X-Content-Type-Options: nosniff\r\n"
+    b"X-Frame-Options: DENY\r\n"
+    b"X-XSS-Protection: 1; mode=block\r\n"
+)
+
+
+def build_response_head(status_code: int, headers: bytes) -> bytes:
+    """Prebuild a status line and header block ending in a %d Content-Length slot."""
+    status = HTTPStatus(status_code)
+    status_line = f"{PROTOCOL_VERSION} {status.value} {status.phrase}\r\n".encode('latin-1')
+    return status_line + headers + b"Content-Length: %d\r\n\r\n"
+
+
+# Bodies at or above this size are sent with a vectored write instead of being
+# concatenated onto the header block, avoiding a full copy of the body
+LARGE_RESPONSE_THRESHOLD = 65_536
+
+
+def sendmsg_all(sock, buffers) -> None:
+    """Send every buffer with scatter/gather sendmsg, resuming after partial sends."""
+    views = [memoryview(buffer) for buffer in buffers]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if sent:
+            views[0] = views[0][sent:]
+
+# Responses after which the connection is closed: the request body may not
+# have been consumed (411, 413) or the handler state is unknown (500, 503)
+CLOSE_CONNECTION_STATUSES = frozenset({411, 413, 500, 503})
+
+JSON_HEADERS = b"Content-Type: application/json\r\n" + SECURITY_HEADERS
+JSON_RESPONSE_HEADS = {
+    status_code: build_response_head(status_code, JSON_HEADERS)
+    for status_code in (200, 400)
+}
+JSON_CLOSE_RESPONSE_HEADS = {
+    status_code: build_response_head(status_code, JSON_HEADERS + b"Connection: close\r\n")
+    for status_code in (400, 411, 413, 500, 503)
+}
+OPTIONS_RESPONSE = build_response_head(200, SECURITY_HEADERS + (
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type, Authorization, Mcp-Session-Id\r\n"
+)) % 0
+
+# Static server descriptor served on GET; serialized once at import time
+SERVER_INFO = {
+    "name": "STRIDE GPT MCP Server",
+    "version": "0.1.0",
+    "description": "Professional threat modeling server using the STRIDE methodology",
+    "tools": [tool["name"] for tool in TOOL_DEFINITIONS],
+    "endpoints": {
+        "POST /": "MCP JSON-RPC endpoint"
+    }
+}
+SERVER_INFO_BYTES = json_dumps(SERVER_INFO)
+
+# The descriptor only changes on deploy, so clients and the edge may cache it
+# and revalidate with If-None-Match; the ETag is derived from the body itself
+SERVER_INFO_ETAG = '"%08x"' % zlib.crc32(SERVER_INFO_BYTES)
+SERVER_INFO_CACHE_HEADERS = (
+    b"Cache-Control: public, max-age=3600\r\n"
+    b"ETag: " + SERVER_INFO_ETAG.encode('ascii') + b"\r\n"
+)
+SERVER_INFO_RESPONSE = build_response_head(
+    200, JSON_HEADERS + SERVER_INFO_CACHE_HEADERS
+) % len(SERVER_INFO_BYTES) + SERVER_INFO_BYTES
+# A 304 carries no body and must not declare a Content-Length other than the 200's
+SERVER_INFO_NOT_MODIFIED_RESPONSE = (
+    f"{PROTOCOL_VERSION} 304 Not Modified\r\n".encode('latin-1')
+    + SECURITY_HEADERS + SERVER_INFO_CACHE_HEADERS + b"\r\n"
+)
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True when an If-None-Match header lists the given entity tag or '*'."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+def build_error_template(code: int, message: str) -> bytes:
+    """
+    Serialize a JSON-RPC error envelope once, leaving %s slots for bytes formatting.
+
+    A %s inside message stays a slot for JSON-escaped message text (see
+    json_fragment); the final slot takes the JSON-encoded request id.
+    """
+    envelope = json_dumps({"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": "\x00"})
+    return envelope.replace(b'"\\u0000"', b'%s')
+
+def json_fragment(text: str) -> bytes:
+    """JSON-escape text for splicing inside a quoted string slot of a template."""
+    return json_dumps(text)[1:-1]
+
+# JSON-RPC error envelopes serialized once at import time; per-request values
+# are spliced in with bytes formatting instead of building and encoding dicts
+INVALID_REQUEST_TEMPLATE = build_error_template(-32600, "Invalid Request")
+PAYLOAD_TOO_LARGE_TEMPLATE = build_error_template(
+    PAYLOAD_TOO_LARGE_CODE, f"Payload size %s bytes exceeds maximum of {MAX_PAYLOAD_SIZE} bytes"
+)
+PAYLOAD_TOO_COMPLEX_TEMPLATE = build_error_template(PAYLOAD_TOO_COMPLEX_CODE, "Payload complexity validation failed: %s")
+INTERNAL_ERROR_TEMPLATE = build_error_template(INTERNAL_ERROR_CODE, "%s")
+
+PARSE_ERROR_BYTES = build_error_template(-32700, "Parse error") % b'null'
+INVALID_REQUEST_BYTES = INVALID_REQUEST_TEMPLATE % b'null'
+INVALID_CONTENT_LENGTH_BYTES = build_error_template(-32600, "Invalid Content-Length header") % b'null'
+LENGTH_REQUIRED_BYTES = build_error_template(-32600, "Request body must be framed by Content-Length") % b'null'
+SERVICE_UNAVAILABLE_BYTES = build_error_template(
+    INTERNAL_ERROR_CODE, "Server is temporarily unable to handle the request"
+) % b'null'
+SERVICE_UNAVAILABLE_RESPONSE = (
+    JSON_CLOSE_RESPONSE_HEADS[503] % len(SERVICE_UNAVAILABLE_BYTES) + SERVICE_UNAVAILABLE_BYTES
+)
+
+def build_result_parts(result: dict[str, object]) -> tuple[bytes, bytes]:
+    """Serialize a JSON-RPC result envelope once, split around its request id slot."""
+    envelope = json_dumps({"jsonrpc": "2.0", "result": result, "id": "\x00"})
+    prefix, _, suffix = envelope.rpartition(b'"\\u0000"')
+    return prefix, suffix
+
+def build_tool_result_parts() -> tuple[bytes, bytes, bytes]:
+    """Serialize the tools/call success envelope once, split around its text and id slots."""
+    prefix, suffix = build_result_parts({"content": [{"type": "text", "text": "\x00"}]})
+    head, _, middle = prefix.partition(b'"\\u0000"')
+    return head, middle, suffix
+
+# Cached tool text is spliced in pre-encoded rather than re-escaped on every response
+TOOL_RESULT_HEAD, TOOL_RESULT_MIDDLE, TOOL_RESULT_TAIL = build_tool_result_parts()
+
+# initialize and tools/list results never change, so their full envelopes are
+# serialized once and each response only encodes the request id between them
+STATIC_RESULT_PARTS = {
+    'initialize': build_result_parts(INITIALIZE_RESULT),
+    'tools/list': build_result_parts(TOOLS_LIST_RESULT)
+}
+
+
+def invalid_request_body(request_id: object) -> bytes:
+    """Return the serialized Invalid Request envelope for the given request id."""
+    if request_id is None:
+        return INVALID_REQUEST_BYTES
+    return INVALID_REQUEST_TEMPLATE % json_dumps(request_id)
+
+def response_body(request: dict) -> bytes:
+    """Serialize the response to a validated JSON-RPC request.
+
+    Static discovery methods are answered from STATIC_RESULT_PARTS and tool calls
+    are spliced around their pre-encoded text from dispatch_tool_call; everything
+    else goes through handle_mcp_request.
+    """
+    method = request['method']
+    if method == 'tools/call':
+        request_id = request.get('id')
+        outcome = dispatch_tool_call(request.get('params', {}))
+        if isinstance(outcome, dict):
+            return json_dumps({"jsonrpc": "2.0", "error": outcome, "id": request_id})
+        return TOOL_RESULT_HEAD + outcome + TOOL_RESULT_MIDDLE + json_dumps(request_id) + TOOL_RESULT_TAIL
+    parts = STATIC_RESULT_PARTS.get(method) if isinstance(method, str) else None
+    if parts is None:
+        return json_dumps(handle_mcp_request(request))
+    return parts[0] + json_dumps(request.get('id')) + parts[1]
+
+def batch_response_body(batch: list) -> bytes:
+    """Dispatch every request in a JSON-RPC batch and join the responses into one array.
+
+    Invalid entries get their own Invalid Request error in the array, and an
+    entry that fails unexpectedly gets its own internal error, rather than either
+    failing the whole batch, so the client receives one response per request.
+    """
+    responses = []
+    for request in batch:
+        if not isinstance(request, dict):
+            responses.append(INVALID_REQUEST_BYTES)
+        elif request.get('jsonrpc') != '2.0' or not request.get('method'):
+            responses.append(invalid_request_body(request.get('id')))
+        else:
+            try:
+                responses.append(response_body(request))
+            except Exception as e:
+                error_id, sanitized_message = sanitize_error(e, "Batch entry handling")
+                responses.append(INTERNAL_ERROR_TEMPLATE % (
+                    json_fragment(sanitized_message), json_dumps(request.get('id'))
+                ))
+    return b'[' + b','.join(responses) + b']'
+
+
 class handler(BaseHTTPRequestHandler):
+    protocol_version = PROTOCOL_VERSION
+    timeout = IDLE_CONNECTION_TIMEOUT
+    # Each response leaves in one write; TCP_NODELAY stops Nagle holding it back
+    # while the previous response on a kept-alive connection awaits its ACK
+    disable_nagle_algorithm = True
+
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, Mcp-Session-Id')
-        self.send_header('X-Content-Type-Options', 'nosniff')
-        self.send_header('X-Frame-Options', 'DENY')
-        self.send_header('X-XSS-Protection', '1; mode=block')
-        self.end_headers()
-        
+        self.close_if_body_unread()
+        self.send_prebuilt(200, OPTIONS_RESPONSE)
+
     def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('X-Content-Type-Options', 'nosniff')
-        self.send_header('X-Frame-Options', 'DENY')
-        self.send_header('X-XSS-Protection', '1; mode=block')
-        self.end_headers()
-        
-        response_data = {
-            "name": "STRIDE GPT MCP Server",
-            "version": "0.1.0",
-            "description": "Professional threat modeling server using the STRIDE methodology",
-            "tools": [
-                "get_stride_threat_framework",
-                "generate_threat_mitigations",
-                "create_threat_attack_trees",
-                "calculate_threat_risk_scores",
-                "generate_security_tests",
-                "generate_threat_report",
-                "validate_threat_coverage",
-                "get_repository_analysis_guide"
-            ],
-            "endpoints": {
-                "POST /": "MCP JSON-RPC endpoint"
-            }
-        }
-        self.wfile.write(json.dumps(response_data, indent=2).encode())
-        
+        self.close_if_body_unread()
+        if etag_matches(self.headers.get('If-None-Match'), SERVER_INFO_ETAG):
+            self.send_prebuilt(304, SERVER_INFO_NOT_MODIFIED_RESPONSE)
+        else:
+            self.send_prebuilt(200, SERVER_INFO_RESPONSE)
+
     def do_POST(self):
         try:
-            content_length = int(self.headers.get('Content-Length', 0))
+            # Only Content-Length framing is supported, and a chunked body cannot be
+            # delimited. RFC 7230 §3.3.3 reads a POST without Content-Length as an
+            # empty body, but refusing it with 411 is deliberate: every MCP request
+            # carries a JSON body, so any bytes that do follow would otherwise be
+            # parsed as the next request on a kept-alive connection
+            if 'Transfer-Encoding' in self.headers or 'Content-Length' not in self.headers:
+                self.send_error_response(411, LENGTH_REQUIRED_BYTES, close=True)
+                return
+
+            content_length = parse_content_length(self.headers['Content-Length'])
+            if content_length is None:
+                # Body framing is unknown, so the connection cannot be reused
+                self.send_error_response(400, INVALID_CONTENT_LENGTH_BYTES, close=True)
+                return
 
             # Validate payload size before reading
-            if content_length > PAYLOAD_LIMITS['MAX_PAYLOAD_SIZE']:
-                self.send_error_response(413, {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": ERROR_CODES['PAYLOAD_TOO_LARGE'],
-                        "message": f"Payload size {content_length} bytes exceeds maximum of {PAYLOAD_LIMITS['MAX_PAYLOAD_SIZE']} bytes"
-                    },
-                    "id": None
-                })
+            if content_length > MAX_PAYLOAD_SIZE:
+                self.send_error_response(413, PAYLOAD_TOO_LARGE_TEMPLATE % (b'%d' % content_length, b'null'))
                 return
 
-            post_data = self.rfile.read(content_length)
+            post_data = self.read_body(content_length)
 
             try:
-                body = json.loads(post_data.decode('utf-8'))
+                body = json_loads(post_data)
             except json.JSONDecodeError:
-                self.send_error_response(400, {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32700, "message": "Parse error"},
-                    "id": None
-                })
+                self.send_error_response(400, PARSE_ERROR_BYTES)
+                return
+
+            # A JSON-RPC request must be an object or a non-empty batch array of them;
+            # reject other roots before any .get
+            is_batch = isinstance(body, list) and len(body) > 0
+            if not (is_batch or isinstance(body, dict)):
+                self.send_error_response(400, INVALID_REQUEST_BYTES)
+                return
+
+            request_id = None if is_batch else body.get('id')
+
+            # Validate the JSON-RPC envelope first: two lookups reject a malformed
+            # single request before any traversal of its contents
+            if not is_batch and (body.get('jsonrpc') != '2.0' or not body.get('method')):
+                self.send_error_response(400, invalid_request_body(request_id))
                 return
 
-            # Validate JSON complexity
-            complexity_result = validate_json_complexity(body)
+            # Validate JSON complexity (skipped when the raw bytes are provably within limits)
+            complexity_result = {'valid': True} if payload_within_limits(post_data) else validate_json_complexity(body)
             if not complexity_result['valid']:
-                self.send_error_response(400, {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": ERROR_CODES['PAYLOAD_TOO_COMPLEX'],
-                        "message": f"Payload complexity validation failed: {complexity_result['error']}"
-                    },
-                    "id": body.get('id')
-                })
+                self.send_error_response(400, PAYLOAD_TOO_COMPLEX_TEMPLATE % (
+                    json_fragment(complexity_result['error']), json_dumps(request_id)
+                ))
                 return
 
-            # Validate JSON-RPC
-            if not body.get('jsonrpc') == '2.0' or not body.get('method'):
-                self.send_error_response(400, {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32600, "message": "Invalid Request"},
-                    "id": body.get('id')
-                })
+            if is_batch:
+                self.send_json(200, batch_response_body(body))
                 return
-            
+
             # Handle MCP request using our improved server
-            response = handle_mcp_request(body)
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('X-Content-Type-Options', 'nosniff')
-            self.send_header('X-Frame-Options', 'DENY')
-            self.send_header('X-XSS-Protection', '1; mode=block')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
-            
+            self.send_json(200, response_body(body))
+
+        except (ConnectionResetError, BrokenPipeError, TimeoutError):
+            # Client disconnected or stalled mid-request; there is nobody to answer
+            self.close_connection = True
+        except MemoryError:
+            # Preallocated body: building a new envelope could fail the same way
+            self.send_error_response(503, SERVICE_UNAVAILABLE_BYTES)
         except Exception as e:
             error_id, sanitized_message = sanitize_error(e, "HTTP POST request handling")
-            self.send_error_response(500, {
-                "jsonrpc": "2.0",
-                "error": {"code": -32603, "message": sanitized_message},
-                "id": None
-            })
+            self.send_error_response(500, INTERNAL_ERROR_TEMPLATE % (json_fragment(sanitized_message), b'null'))
     
-    def send_error_response(self, status_code, error_data):
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(error_data).encode())
\ No newline at end of file
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        # Between requests the connection is registered as idle, so a saturated
+        # pool can evict it; the wait itself is the blocking read of the next
+        # request line, bounded by the socket timeout
+        while not self.close_connection and self.connection_idle():
+            try:
+                self.handle_one_request()
+            finally:
+                self.connection_busy()
+
+    def parse_request(self):
+        # The next request line has arrived, so the connection is no longer idle
+        self.connection_busy()
+        return super().parse_request()
+
+    def connection_idle(self) -> bool:
+        """Register the kept-alive connection as idle; False means close it instead."""
+        connection_idle = getattr(self.server, 'connection_idle', None)
+        return connection_idle is None or connection_idle(self.connection)
+
+    def connection_busy(self):
+        connection_busy = getattr(self.server, 'connection_busy', None)
+        if connection_busy is not None:
+            connection_busy(self.connection)
+
+    def close_if_body_unread(self):
+        """Close the connection after a bodiless method whose request declared a body.
+
+        GET and OPTIONS never read a body, so any bytes sent with one would
+        otherwise be parsed as the next request on the connection.
+        """
+        if 'Transfer-Encoding' in self.headers or self.headers.get('Content-Length', '0') != '0':
+            self.close_connection = True
+
+    def read_body(self, content_length: int) -> bytearray:
+        """Read the request body straight into a preallocated buffer.
+
+        The buffer is parsed as-is (orjson and json both accept bytearray), so
+        the payload is never copied into an intermediate bytes or str object.
+        """
+        buffer = bytearray(content_length)
+        bytes_read = self.rfile.readinto(buffer) or 0
+        if bytes_read < content_length:
+            del buffer[bytes_read:]
+        return buffer
+
+    def log_request(self, code='-', size='-'):
+        if ACCESS_LOG:
+            super().log_request(code, size)
+
+    def send_prebuilt(self, status_code: int, response: bytes):
+        """Write a complete response (status line, headers, body) built at import time."""
+        self.log_request(status_code)
+        self.wfile.write(response)
+
+    def send_json(self, status_code: int, body: bytes, close: bool = False):
+        """Write the status line, prebuilt headers, and body in a single write."""
+        if close or status_code in CLOSE_CONNECTION_STATUSES:
+            self.close_connection = True
+            head = JSON_CLOSE_RESPONSE_HEADS[status_code]
+        else:
+            head = JSON_RESPONSE_HEADS[status_code]
+        self.log_request(status_code)
+        head = head % len(body)
+        if len(body) >= LARGE_RESPONSE_THRESHOLD and hasattr(self.connection, 'sendmsg'):
+            self.wfile.flush()
+            sendmsg_all(self.connection, (head, body))
+        else:
+            self.wfile.write(head + body)
+
+    def send_error_response(self, status_code, error_data, close=False):
+        # Accept either an envelope dict or pre-serialized bytes
+        body = error_data if isinstance(error_data, bytes) else json_dumps(error_data)
+        self.send_json(status_code, body, close)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that serves each connection on a bounded thread pool.
+
+    Unlike ThreadingHTTPServer, which starts a thread per connection, the pool
+    caps concurrency so a burst of clients cannot exhaust threads. A keep-alive
+    connection occupies a worker until it closes or idles out. When a connection
+    is queued while every worker is busy, one idle keep-alive connection is
+    evicted by shutting down its read side, which ends its blocking read at once.
+    Connections beyond max_queued waiting ones are refused with a 503.
+
+    With reuse_port, SO_REUSEPORT lets several server processes bind the same
+    port, with the kernel spreading new connections across them. It is off by
+    default so a second server on a taken port fails with EADDRINUSE instead of
+    silently sharing its traffic.
+    """
+
+    def __init__(self, server_address, RequestHandlerClass, max_workers: int | None = None,
+                 reuse_port: bool = False, max_queued: int = MAX_QUEUED_CONNECTIONS):
+        self.allow_reuse_port = reuse_port
+        # Created before binding: a failed bind calls server_close(), which shuts it down
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.max_connections = self.max_workers + max_queued
+        super().__init__(server_address, RequestHandlerClass)
+        # Accepted connections not yet closed, whether served or queued, and the
+        # kept-alive ones currently waiting between requests
+        self.open_connections = 0
+        self.idle_connections = set()
+        self.connections_lock = threading.Lock()
+
+    def connection_idle(self, connection) -> bool:
+        """Register a connection waiting for its next request, unless others are queued."""
+        with self.connections_lock:
+            if self.open_connections > self.max_workers:
+                return False
+            self.idle_connections.add(connection)
+            return True
+
+    def connection_busy(self, connection):
+        with self.connections_lock:
+            self.idle_connections.discard(connection)
+
+    def process_request(self, request, client_address):
+        evicted = None
+        with self.connections_lock:
+            if self.open_connections >= self.max_connections:
+                evicted = request
+            else:
+                self.open_connections += 1
+                if self.open_connections > self.max_workers and self.idle_connections:
+                    evicted = self.idle_connections.pop()
+        if evicted is request:
+            try:
+                request.sendall(SERVICE_UNAVAILABLE_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        if evicted is not None:
+            try:
+                evicted.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        self.executor.submit(self.process_request_worker, request, client_address)
+
+    def process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self.connections_lock:
+                self.open_connections -= 1
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+if __name__ == '__main__':
+    # Local development server; on Vercel the runtime imports `handler` directly.
+    # WORKERS > 1 forks processes sharing the port, since the GIL keeps a single
+    # process's worker threads on one core. The parent only supervises: it
+    # forwards termination signals to the workers and reaps them
+    workers = int(os.environ.get('WORKERS', 1)) if hasattr(os, 'fork') else 1
+    if workers > 1:
+        import signal
+
+        children = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                children = None
+                break
+            children.append(pid)
+
+        if children is not None:
+            def forward_signal(signum, frame):
+                for child in children:
+                    try:
+                        os.kill(child, signum)
+                    except ProcessLookupError:
+                        pass
+
+            signal.signal(signal.SIGTERM, forward_signal)
+            signal.signal(signal.SIGINT, forward_signal)
+            for child in children:
+                os.waitpid(child, 0)
+            sys.exit(0)
+
+    server = PooledHTTPServer(('', int(os.environ.get('PORT', 8000))), handler, reuse_port=workers > 1)
+    print(f"STRIDE GPT MCP Server listening on http://localhost:{server.server_port} (pid {os.getpid()})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
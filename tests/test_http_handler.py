@@ -10,12 +10,72 @@ Note: Full HTTP integration testing is done at the MCP handler level.
 import pytest
 import sys
 import os
+import io
 import json
+import threading
+import time
+import http.client
+import socket
+from email.message import Message
 
 # Add api directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
 
-from index import handler, handle_mcp_request, validate_json_complexity, PAYLOAD_LIMITS, sanitize_error
+from index import (
+    handler, PooledHTTPServer, handle_mcp_request, validate_json_complexity, payload_within_limits,
+    parse_content_length, sendmsg_all, PAYLOAD_LIMITS, sanitize_error
+)
+
+
+class CountingWriter(io.BytesIO):
+    """In-memory wfile that records how many writes each response took."""
+
+    def __init__(self):
+        super().__init__()
+        self.write_count = 0
+
+    def write(self, data):
+        self.write_count += 1
+        return super().write(data)
+
+
+def make_request(method, body=b'', headers=None, wfile=None):
+    """Drive the handler with in-memory streams and return (status, headers, body)."""
+    request_headers = Message()
+    for name, value in (headers or {}).items():
+        request_headers[name] = value
+    if body and 'Content-Length' not in request_headers:
+        request_headers['Content-Length'] = str(len(body))
+
+    h = handler.__new__(handler)
+    h.rfile = io.BytesIO(body)
+    h.wfile = wfile if wfile is not None else io.BytesIO()
+    h.headers = request_headers
+    h.command = method
+    h.path = '/'
+    h.request_version = 'HTTP/1.1'
+    h.requestline = f'{method} / HTTP/1.1'
+    h.client_address = ('127.0.0.1', 0)
+    h.connection = None
+    h.close_connection = True
+    h.log_message = lambda *args: None
+    getattr(h, f'do_{method}')()
+
+    raw = h.wfile.getvalue()
+    head, _, payload = raw.partition(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split()[1])
+    response_headers = dict(line.split(': ', 1) for line in lines[1:])
+    return status, response_headers, payload
+
+
+def read_until_closed(sock):
+    """Read everything the server sends until it closes the connection."""
+    received = b''
+    while chunk := sock.recv(65_536):
+        received += chunk
+    sock.close()
+    return received
 
 
 class TestMCPIntegration:
@@ -430,6 +490,33 @@ class TestPayloadValidation:
         assert result['valid'] is False
         assert 'key length' in result['error'].lower()
 
+    def test_precheck_accepts_small_payload(self):
+        """Test the byte-level precheck accepts typical small requests."""
+        raw = json.dumps({'jsonrpc': '2.0', 'method': 'initialize', 'id': 1}).encode()
+        assert payload_within_limits(raw) is True
+
+    def test_precheck_is_inconclusive_for_large_payloads(self):
+        """Test the precheck defers to full validation when bounds may be exceeded."""
+        deep = b'[' * 25 + b']' * 25
+        wide = json.dumps(list(range(600))).encode()
+        long_string = json.dumps('a' * (PAYLOAD_LIMITS['MAX_STRING_LENGTH'] + 1)).encode()
+
+        for raw in (deep, wide, long_string):
+            assert payload_within_limits(raw) is False
+
+    def test_precheck_never_accepts_invalid_payload(self):
+        """Test every payload the precheck accepts also passes full validation."""
+        payloads = [
+            {'a': [[[[1]]]]},
+            list(range(499)),
+            {f'k{i}': i for i in range(499)},
+            'x' * 1000,
+        ]
+        for data in payloads:
+            raw = json.dumps(data).encode()
+            if payload_within_limits(raw):
+                assert validate_json_complexity(data)['valid'] is True
+
     def test_payload_limits_constants(self):
         """Test that payload limit constants are defined correctly."""
         assert PAYLOAD_LIMITS['MAX_PAYLOAD_SIZE'] == 5_242_880  # 5MB
@@ -533,7 +620,7 @@ class TestErrorSanitization:
         import index as index_module
 
         # Save original function
-        original_function = index_module.get_stride_threat_framework
+        original_function = index_module.TOOL_HANDLERS['get_stride_threat_framework']
 
         # Create a function that raises an error with sensitive information
         def broken_function(args):
@@ -541,7 +628,7 @@ class TestErrorSanitization:
 
         try:
             # Replace the function temporarily
-            index_module.get_stride_threat_framework = broken_function
+            index_module.TOOL_HANDLERS['get_stride_threat_framework'] = broken_function
 
             # Make a request that will trigger the broken function
             request = {
@@ -574,7 +661,7 @@ class TestErrorSanitization:
 
         finally:
             # Restore original function
-            index_module.get_stride_threat_framework = original_function
+            index_module.TOOL_HANDLERS['get_stride_threat_framework'] = original_function
 
     def test_error_id_uniqueness(self):
         """Test that each error gets a unique error ID."""
@@ -604,3 +691,643 @@ class TestErrorSanitization:
             assert "sensitive operation context" not in sanitized_message
             # Only generic message should be present
             assert "An internal error occurred" in sanitized_message
+
+
+class TestHTTPHandler:
+    """Tests for the HTTP request handler methods."""
+
+    def test_get_returns_server_info(self):
+        """Test GET returns the static server descriptor."""
+        status, headers, payload = make_request('GET')
+
+        assert status == 200
+        assert headers['Content-Type'] == 'application/json'
+        info = json.loads(payload)
+        assert info['name'] == 'STRIDE GPT MCP Server'
+        assert len(info['tools']) == 8
+
+    def test_get_sets_cache_validators(self):
+        """Test the server descriptor is cacheable and carries an ETag."""
+        _, headers, _ = make_request('GET')
+
+        assert headers['Cache-Control'] == 'public, max-age=3600'
+        assert headers['ETag'].startswith('"') and headers['ETag'].endswith('"')
+
+    def test_get_conditional_not_modified(self):
+        """Test a matching If-None-Match gets a bodiless 304 and a stale one gets 200."""
+        _, headers, _ = make_request('GET')
+        etag = headers['ETag']
+
+        for if_none_match in (etag, f'"stale", W/{etag}', '*'):
+            status, headers, payload = make_request('GET', headers={'If-None-Match': if_none_match})
+            assert status == 304
+            assert headers['ETag'] == etag
+            assert 'Content-Length' not in headers
+            assert payload == b''
+
+        status, _, payload = make_request('GET', headers={'If-None-Match': '"stale"'})
+        assert status == 200
+        assert json.loads(payload)['name'] == 'STRIDE GPT MCP Server'
+
+    def test_post_initialize(self):
+        """Test POST routes a JSON-RPC request to the MCP handler."""
+        body = json.dumps({'jsonrpc': '2.0', 'method': 'initialize', 'id': 1}).encode()
+        status, headers, payload = make_request('POST', body)
+
+        assert status == 200
+        response = json.loads(payload)
+        assert response['id'] == 1
+        assert response['result']['serverInfo']['name'] == 'STRIDE GPT MCP Server'
+
+    def test_post_accepts_utf8_bytes(self):
+        """Test non-ASCII request bodies are parsed from raw bytes."""
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'tools/call',
+            'params': {
+                'name': 'get_stride_threat_framework',
+                'arguments': {'app_description': 'Zahlungsdienst für Bürger'}
+            },
+            'id': 2
+        }, ensure_ascii=False).encode('utf-8')
+        status, _, payload = make_request('POST', body)
+
+        assert status == 200
+        text = json.loads(payload)['result']['content'][0]['text']
+        assert json.loads(text)['application_context']['app_description'] == 'Zahlungsdienst für Bürger'
+
+    def test_post_truncated_body(self):
+        """Test a body cut short of its Content-Length yields a parse error."""
+        body = json.dumps({'jsonrpc': '2.0', 'method': 'initialize', 'id': 1}).encode()
+        status, _, payload = make_request('POST', body[:-5], {'Content-Length': str(len(body))})
+
+        assert status == 400
+        assert json.loads(payload)['error']['code'] == -32700
+
+    def test_post_parse_error(self):
+        """Test malformed JSON returns a -32700 parse error."""
+        status, _, payload = make_request('POST', b'{not json')
+
+        assert status == 400
+        response = json.loads(payload)
+        assert response['error']['code'] == -32700
+        assert response['id'] is None
+
+    def test_post_invalid_request(self):
+        """Test a body without a method returns -32600."""
+        body = json.dumps({'jsonrpc': '2.0', 'id': 5}).encode()
+        status, _, payload = make_request('POST', body)
+
+        assert status == 400
+        response = json.loads(payload)
+        assert response['error']['code'] == -32600
+        assert response['id'] == 5
+
+    def test_post_too_deep_rejected(self):
+        """Test deeply nested payloads are still rejected at the HTTP layer."""
+        body = b'{"jsonrpc": "2.0", "method": "initialize", "id": 1, "x": ' + b'[' * 25 + b']' * 25 + b'}'
+        status, _, payload = make_request('POST', body)
+
+        assert status == 400
+        response = json.loads(payload)
+        assert 'nesting depth' in response['error']['message']
+        assert response['id'] == 1
+
+    def test_post_invalid_envelope_rejected_before_complexity(self):
+        """Test a bad envelope is rejected as Invalid Request without walking its payload."""
+        body = b'{"jsonrpc": "1.0", "method": "initialize", "id": 1, "x": ' + b'[' * 25 + b']' * 25 + b'}'
+        status, _, payload = make_request('POST', body)
+
+        assert status == 400
+        response = json.loads(payload)
+        assert response['error']['code'] == -32600
+        assert response['id'] == 1
+
+    def test_invalid_request_body_reuses_constant(self):
+        """Test the id-less Invalid Request envelope is the pre-serialized constant."""
+        from index import invalid_request_body, INVALID_REQUEST_BYTES
+
+        assert invalid_request_body(None) is INVALID_REQUEST_BYTES
+        assert json.loads(invalid_request_body(7))['id'] == 7
+
+    def test_post_non_object_body(self):
+        """Test valid JSON that is not an object returns Invalid Request, not a 500."""
+        for body in (b'42', b'"initialize"', b'null'):
+            status, _, payload = make_request('POST', body)
+
+            assert status == 400
+            response = json.loads(payload)
+            assert response['error']['code'] == -32600
+            assert response['id'] is None
+
+    def test_static_results_match_handler(self):
+        """Test prebuilt initialize and tools/list bodies equal the handler's responses."""
+        for method in ('initialize', 'tools/list'):
+            for request_id in (1, 'abc', None, 2.5):
+                body = json.dumps({'jsonrpc': '2.0', 'method': method, 'id': request_id}).encode()
+                status, _, payload = make_request('POST', body)
+
+                assert status == 200
+                assert json.loads(payload) == handle_mcp_request({'method': method, 'id': request_id})
+
+    def test_tool_call_bodies_match_handler(self):
+        """Test spliced tools/call bodies equal the handler's responses, including failures."""
+        calls = [
+            ('get_stride_threat_framework', {'app_description': 'Splice test'}),
+            ('generate_threat_report', {'threat_model': [{'id': 'T1'}]}),
+            ('get_repository_analysis_guide', {'analysis_stage': 'validation'}),
+            ('get_stride_threat_framework', None),
+            ('unknown_tool', {})
+        ]
+        for name, arguments in calls:
+            request = {'jsonrpc': '2.0', 'method': 'tools/call', 'params': {'name': name, 'arguments': arguments}, 'id': 5}
+            status, _, payload = make_request('POST', json.dumps(request).encode())
+            expected = handle_mcp_request(request)
+
+            assert status == 200
+            if 'error' in expected:
+                assert json.loads(payload)['error']['code'] == expected['error']['code']
+            else:
+                assert json.loads(payload) == expected
+
+    def test_large_integer_ids_echoed_exactly(self):
+        """Test integer ids beyond 64 bits round-trip unchanged, alone and in a batch."""
+        big_id = 123456789012345678901234567890
+        requests = [
+            {'jsonrpc': '2.0', 'method': 'initialize', 'id': big_id},
+            {'jsonrpc': '2.0', 'method': 'tools/call', 'id': -big_id,
+             'params': {'name': 'get_repository_analysis_guide', 'arguments': {}}},
+            {'jsonrpc': '2.0', 'method': 'resources/list', 'id': big_id}
+        ]
+        for request in requests:
+            status, _, payload = make_request('POST', json.dumps(request).encode())
+
+            assert status == 200
+            assert json.loads(payload)['id'] == request['id']
+
+        status, _, payload = make_request('POST', json.dumps(requests).encode())
+        assert [response['id'] for response in json.loads(payload)] == [big_id, -big_id, big_id]
+
+    def test_failing_tool_call_runs_once(self, monkeypatch):
+        """Test a failing tool is answered with a sanitized error without a second run."""
+        import index as index_module
+        calls = []
+
+        def broken(args):
+            calls.append(args)
+            raise RuntimeError('secret detail')
+
+        monkeypatch.setitem(index_module.TOOL_HANDLERS, 'get_stride_threat_framework', broken)
+        request = {
+            'jsonrpc': '2.0', 'method': 'tools/call', 'id': 7,
+            'params': {'name': 'get_stride_threat_framework', 'arguments': {'app_description': 'Runs once'}}
+        }
+        status, _, payload = make_request('POST', json.dumps(request).encode())
+
+        assert status == 200
+        response = json.loads(payload)
+        assert response['error']['code'] == -32604
+        assert 'secret detail' not in response['error']['message']
+        assert response['id'] == 7
+        assert len(calls) == 1
+
+    def test_post_batch_request(self):
+        """Test a JSON-RPC batch is answered with one response per request, in order."""
+        body = json.dumps([
+            {'jsonrpc': '2.0', 'method': 'initialize', 'id': 1},
+            {'jsonrpc': '2.0', 'method': 'tools/list', 'id': 'two'},
+            {'jsonrpc': '2.0', 'method': 'tools/call', 'params': {'name': 'get_repository_analysis_guide', 'arguments': {}}, 'id': 3}
+        ]).encode()
+        status, _, payload = make_request('POST', body)
+
+        assert status == 200
+        responses = json.loads(payload)
+        assert [r['id'] for r in responses] == [1, 'two', 3]
+        assert responses[0]['result']['serverInfo']['name'] == 'STRIDE GPT MCP Server'
+        assert len(responses[1]['result']['tools']) == 8
+        assert 'text' in responses[2]['result']['content'][0]
+
+    def test_post_batch_invalid_entries(self):
+        """Test invalid batch entries get their own errors without failing the batch."""
+        body = json.dumps([
+            42,
+            {'jsonrpc': '1.0', 'method': 'initialize', 'id': 'old'},
+            {'jsonrpc': '2.0', 'method': 'tools/call', 'params': None, 'id': 'null-params'},
+            {'jsonrpc': '2.0', 'method': 'tools/call', 'params': [1], 'id': 'list-params'},
+            {'jsonrpc': '2.0', 'method': 'initialize', 'id': 3}
+        ]).encode()
+        status, _, payload = make_request('POST', body)
+
+        assert status == 200
+        first, second, third, fourth, fifth = json.loads(payload)
+        assert first['error']['code'] == -32600 and first['id'] is None
+        assert second['error']['code'] == -32600 and second['id'] == 'old'
+        assert third['error']['code'] == -32602 and third['id'] == 'null-params'
+        assert fourth['error']['code'] == -32602 and fourth['id'] == 'list-params'
+        assert 'result' in fifth
+
+    def test_post_batch_entry_failure_isolated(self, monkeypatch):
+        """Test an entry that raises gets its own -32603 error inside the batch."""
+        import index as index_module
+
+        def broken(body):
+            raise RuntimeError('secret detail')
+
+        monkeypatch.setattr(index_module, 'handle_mcp_request', broken)
+        body = json.dumps([
+            {'jsonrpc': '2.0', 'method': 'resources/list', 'id': 1},
+            {'jsonrpc': '2.0', 'method': 'initialize', 'id': 2}
+        ]).encode()
+        status, _, payload = make_request('POST', body)
+
+        assert status == 200
+        first, second = json.loads(payload)
+        assert first['error']['code'] == -32603 and first['id'] == 1
+        assert 'secret detail' not in first['error']['message']
+        assert 'result' in second
+
+    def test_post_empty_batch(self):
+        """Test an empty batch array is rejected as a single Invalid Request."""
+        status, _, payload = make_request('POST', b'[]')
+
+        assert status == 400
+        assert json.loads(payload)['error']['code'] == -32600
+
+    def test_post_malformed_content_length(self):
+        """Test an empty or non-numeric Content-Length is a 400 that closes the connection."""
+        for value in ('', 'abc', '-5', '1e3', '²', '9' * 20):
+            status, headers, payload = make_request('POST', b'{}', {'Content-Length': value})
+
+            assert status == 400, value
+            assert headers['Connection'] == 'close'
+            assert 'Content-Length' in json.loads(payload)['error']['message']
+
+    def test_parse_content_length(self):
+        """Test Content-Length parsing of valid, empty, and malformed values."""
+        assert parse_content_length('0') == 0
+        assert parse_content_length('1024') == 1024
+        assert parse_content_length('') is None
+        assert parse_content_length(' 12') is None
+        assert parse_content_length('0x10') is None
+
+    def test_error_templates_match_dict_encoding(self):
+        """Test spliced error templates decode to the same envelope as a built dict."""
+        from index import build_error_template, json_fragment
+
+        template = build_error_template(-32600, 'Bad value: %s')
+        for request_id in (None, 7, 'req-"quoted"', {'nested': [1, 2]}):
+            message = 'contains "quotes" and \\ backslash %d'
+            body = template % (json_fragment(message), json.dumps(request_id).encode())
+            assert json.loads(body) == {
+                'jsonrpc': '2.0',
+                'error': {'code': -32600, 'message': f'Bad value: {message}'},
+                'id': request_id
+            }
+
+    def test_post_internal_error_envelope(self, monkeypatch):
+        """Test unexpected exceptions return a sanitized -32603 envelope."""
+        import index as index_module
+
+        def broken(body):
+            raise RuntimeError('secret detail')
+
+        monkeypatch.setattr(index_module, 'handle_mcp_request', broken)
+        body = json.dumps({'jsonrpc': '2.0', 'method': 'resources/list', 'id': 1}).encode()
+        status, _, payload = make_request('POST', body)
+
+        assert status == 500
+        response = json.loads(payload)
+        assert response['error']['code'] == -32603
+        assert 'secret detail' not in response['error']['message']
+        assert response['id'] is None
+
+    def test_params_parsed_alike_with_or_without_orjson(self, monkeypatch):
+        """Test large integers and lone surrogates in params are served exactly either way."""
+        import index as index_module
+        big = 123456789012345678901234567890
+        body = (
+            b'{"jsonrpc":"2.0","method":"tools/call","id":1,"params":{"name":"get_repository_analysis_guide",'
+            b'"arguments":{"repository_context":{"stars":123456789012345678901234567890,"name":"\\ud800"}}}}'
+        )
+        responses = [make_request('POST', body)]
+        monkeypatch.setattr(index_module, 'orjson', None)
+        responses.append(make_request('POST', body))
+
+        for status, _, payload in responses:
+            assert status == 200
+            text = json.loads(payload)['result']['content'][0]['text']
+            assert json.loads(text)['repository_context'] == {'stars': big, 'name': '\ud800'}
+
+    def test_lone_surrogate_without_orjson(self, monkeypatch):
+        """Test the stdlib fallback serves arguments holding lone surrogate escapes."""
+        import index as index_module
+
+        monkeypatch.setattr(index_module, 'orjson', None)
+        body = (
+            b'{"jsonrpc":"2.0","method":"tools/call","params":{"name":"get_stride_threat_framework",'
+            b'"arguments":{"app_description":"\\ud800 fallback"}},"id":1}'
+        )
+        status, _, payload = make_request('POST', body)
+
+        assert status == 200
+        text = json.loads(payload)['result']['content'][0]['text']
+        assert json.loads(text)['application_context']['app_description'] == '\ud800 fallback'
+
+    def test_post_payload_too_large(self):
+        """Test oversized Content-Length is rejected before reading the body."""
+        size = PAYLOAD_LIMITS['MAX_PAYLOAD_SIZE'] + 1
+        status, _, payload = make_request('POST', headers={'Content-Length': str(size)})
+
+        assert status == 413
+        response = json.loads(payload)
+        assert str(size) in response['error']['message']
+
+    def test_options_preflight(self):
+        """Test OPTIONS returns CORS preflight headers."""
+        status, headers, _ = make_request('OPTIONS')
+
+        assert status == 200
+        assert headers['Access-Control-Allow-Origin'] == '*'
+        assert 'POST' in headers['Access-Control-Allow-Methods']
+
+    def test_security_headers_on_all_responses(self):
+        """Test success and error responses both carry the security headers."""
+        for method, body in (('GET', b''), ('POST', b'{not json')):
+            _, headers, _ = make_request(method, body)
+
+            assert headers['X-Content-Type-Options'] == 'nosniff'
+            assert headers['X-Frame-Options'] == 'DENY'
+            assert headers['X-XSS-Protection'] == '1; mode=block'
+            assert headers['Access-Control-Allow-Origin'] == '*'
+
+    def test_access_log_opt_in(self, monkeypatch):
+        """Test per-request access lines are only written when ACCESS_LOG is enabled."""
+        import index as index_module
+        logged = []
+        h = handler.__new__(handler)
+        h.requestline = 'GET / HTTP/1.1'
+        h.log_message = lambda *args: logged.append(args)
+
+        monkeypatch.setattr(index_module, 'ACCESS_LOG', False)
+        h.log_request(200)
+        assert logged == []
+
+        monkeypatch.setattr(index_module, 'ACCESS_LOG', True)
+        h.log_request(200)
+        assert len(logged) == 1
+
+    def test_client_disconnect_writes_nothing(self):
+        """Test a connection reset while reading the body skips the error response."""
+        class ResetReader(io.BytesIO):
+            def readinto(self, buffer):
+                raise ConnectionResetError()
+
+        h = handler.__new__(handler)
+        h.rfile = ResetReader()
+        h.wfile = io.BytesIO()
+        h.headers = Message()
+        h.headers['Content-Length'] = '10'
+        h.close_connection = False
+        h.do_POST()
+
+        assert h.wfile.getvalue() == b''
+        assert h.close_connection is True
+
+    def test_memory_error_returns_503(self, monkeypatch):
+        """Test MemoryError is answered with the preallocated 503 body."""
+        import index as index_module
+
+        def exhausted(body):
+            raise MemoryError()
+
+        monkeypatch.setattr(index_module, 'handle_mcp_request', exhausted)
+        body = json.dumps({'jsonrpc': '2.0', 'method': 'resources/list', 'id': 1}).encode()
+        status, headers, payload = make_request('POST', body)
+
+        assert status == 503
+        assert headers['Connection'] == 'close'
+        assert json.loads(payload)['error']['code'] == -32603
+
+    def test_single_write_per_response(self):
+        """Test status line, headers, and body go out in one write call."""
+        requests = (
+            ('GET', b''),
+            ('OPTIONS', b''),
+            ('POST', json.dumps({'jsonrpc': '2.0', 'method': 'tools/list', 'id': 1}).encode()),
+            ('POST', b'{not json'),
+        )
+        for method, body in requests:
+            wfile = CountingWriter()
+            make_request(method, body, wfile=wfile)
+            assert wfile.write_count == 1, method
+
+    def test_content_length_matches_body(self):
+        """Test responses declare the exact body length."""
+        _, headers, payload = make_request('GET')
+        assert int(headers['Content-Length']) == len(payload)
+
+        _, headers, payload = make_request('OPTIONS')
+        assert int(headers['Content-Length']) == len(payload) == 0
+
+
+class TestKeepAlive:
+    """Tests for HTTP/1.1 persistent connections over a real socket."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        monkeypatch.setattr(handler, 'log_message', lambda *args: None)
+        server = PooledHTTPServer(('127.0.0.1', 0), handler, max_workers=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_connection_reused_across_requests(self, server):
+        """Test several JSON-RPC calls are served over one connection."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5)
+        conn.connect()
+        sock = conn.sock
+
+        for request_id in range(3):
+            body = json.dumps({'jsonrpc': '2.0', 'method': 'initialize', 'id': request_id})
+            conn.request('POST', '/', body, {'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())['id'] == request_id
+
+        assert conn.sock is sock
+        conn.close()
+
+    def test_concurrent_connections(self, server):
+        """Test two open keep-alive connections are served side by side."""
+        first = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5)
+        second = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5)
+
+        for conn in (first, second, first, second):
+            conn.request('GET', '/')
+            response = conn.getresponse()
+            assert response.status == 200
+            response.read()
+
+        first.close()
+        second.close()
+
+    def test_idle_connections_yield_saturated_pool(self, server):
+        """Test idle keep-alive connections holding every worker do not stall a new client."""
+        idle = [http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5) for _ in range(2)]
+        for conn in idle:
+            conn.request('GET', '/')
+            response = conn.getresponse()
+            assert response.status == 200
+            response.read()
+
+        started = time.monotonic()
+        third = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5)
+        third.request('GET', '/')
+        response = third.getresponse()
+        assert response.status == 200
+        response.read()
+        assert time.monotonic() - started < 2
+
+        for conn in (third, *idle):
+            conn.close()
+
+    def test_connections_beyond_queue_refused(self, monkeypatch):
+        """Test connections past the worker pool and queue get a 503 instead of piling up."""
+        monkeypatch.setattr(handler, 'log_message', lambda *args: None)
+        server = PooledHTTPServer(('127.0.0.1', 0), handler, max_workers=1, max_queued=1)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        # One connection holds the worker and one waits in the queue
+        holders = [socket.create_connection(('127.0.0.1', server.server_port), timeout=5) for _ in range(2)]
+        try:
+            deadline = time.monotonic() + 5
+            while server.open_connections < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            refused = socket.create_connection(('127.0.0.1', server.server_port), timeout=5)
+            received = read_until_closed(refused)
+
+            assert received.startswith(b'HTTP/1.1 503 ')
+            assert b'Connection: close\r\n' in received
+        finally:
+            for sock in holders:
+                sock.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_large_response_over_keep_alive(self, server):
+        """Test a response above the vectored-write threshold arrives intact."""
+        threats = [{'id': f'T{i}', 'category': 'S', 'description': 'x' * 200} for i in range(500)]
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'tools/call',
+            'params': {'name': 'generate_threat_mitigations', 'arguments': {'threats': threats}},
+            'id': 1
+        })
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5)
+
+        for _ in range(2):
+            conn.request('POST', '/', body, {'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            payload = response.read()
+            assert len(payload) > 65_536
+            text = json.loads(payload)['result']['content'][0]['text']
+            assert len(json.loads(text)['threat_context']) == 500
+
+        conn.close()
+
+    def test_sendmsg_all_sends_every_byte(self):
+        """Test vectored sends deliver all buffers in order."""
+        left, right = socket.socketpair()
+        buffers = (b'head\r\n\r\n', b'x' * 300_000)
+        received = bytearray()
+
+        def reader():
+            while len(received) < sum(map(len, buffers)):
+                received.extend(right.recv(65_536))
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        sendmsg_all(left, buffers)
+        thread.join(timeout=5)
+        left.close()
+        right.close()
+
+        assert bytes(received) == b''.join(buffers)
+
+    def test_payload_too_large_closes_connection(self, server):
+        """Test a 413 closes the connection since the body was not consumed."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=5)
+        conn.putrequest('POST', '/')
+        conn.putheader('Content-Length', str(PAYLOAD_LIMITS['MAX_PAYLOAD_SIZE'] + 1))
+        conn.endheaders()
+        response = conn.getresponse()
+
+        assert response.status == 413
+        assert response.getheader('Connection') == 'close'
+        response.read()
+        conn.close()
+
+    def test_chunked_post_closes_without_reading_body(self, server):
+        """Test a chunked POST is refused and its body is never parsed as a request."""
+        sock = socket.create_connection(('127.0.0.1', server.server_port), timeout=5)
+        sock.sendall(
+            b'POST / HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'GET / HTTP/1.1\r\nHost: x\r\n\r\n'
+        )
+        received = read_until_closed(sock)
+
+        assert received.startswith(b'HTTP/1.1 411 ')
+        assert b'Connection: close\r\n' in received
+        assert received.count(b'HTTP/1.1 ') == 1
+
+    def test_post_without_content_length_closes_connection(self, server):
+        """Test a POST with no body framing gets a 411 and a closed connection."""
+        sock = socket.create_connection(('127.0.0.1', server.server_port), timeout=5)
+        sock.sendall(b'POST / HTTP/1.1\r\nHost: x\r\n\r\n{"jsonrpc":"2.0"}')
+        received = read_until_closed(sock)
+
+        assert received.startswith(b'HTTP/1.1 411 ')
+        assert received.count(b'HTTP/1.1 ') == 1
+
+    def test_get_with_body_closes_connection(self, server):
+        """Test a GET that declares a body is answered and then closed."""
+        sock = socket.create_connection(('127.0.0.1', server.server_port), timeout=5)
+        sock.sendall(b'GET / HTTP/1.1\r\nHost: x\r\nContent-Length: 29\r\n\r\nGET / HTTP/1.1\r\nHost: x\r\n\r\n')
+        received = read_until_closed(sock)
+
+        assert received.startswith(b'HTTP/1.1 200 ')
+        assert received.count(b'HTTP/1.1 ') == 1
+
+    @pytest.mark.skipif(not hasattr(socket, 'SO_REUSEPORT'), reason='SO_REUSEPORT unavailable')
+    def test_listening_socket_allows_port_sharing(self):
+        """Test reuse_port sets SO_REUSEPORT so worker processes can share the port."""
+        first = PooledHTTPServer(('127.0.0.1', 0), handler, max_workers=1, reuse_port=True)
+        second = PooledHTTPServer(('127.0.0.1', first.server_port), handler, max_workers=1, reuse_port=True)
+        try:
+            assert first.socket.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT) != 0
+        finally:
+            second.server_close()
+            first.server_close()
+
+    def test_port_not_shared_by_default(self, server):
+        """Test a second server on a taken port fails instead of sharing its traffic."""
+        with pytest.raises(OSError):
+            PooledHTTPServer(('127.0.0.1', server.server_port), handler, max_workers=1)
+
+    def test_nagle_disabled_on_connections(self):
+        """Test handler setup enables TCP_NODELAY on the client socket."""
+        listener = socket.create_server(('127.0.0.1', 0))
+        client = socket.create_connection(listener.getsockname())
+        accepted, _ = listener.accept()
+        try:
+            h = handler.__new__(handler)
+            h.request = accepted
+            h.setup()
+
+            assert accepted.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) != 0
+        finally:
+            for sock in (accepted, client, listener):
+                sock.close()
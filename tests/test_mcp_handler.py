@@ -71,6 +71,15 @@ class TestMCPInitialize:
         assert server_info['name'] == 'STRIDE GPT MCP Server'
         assert server_info['version'] == '0.1.0'
 
+    def test_initialize_result_shared_across_ids(self):
+        """Test the static result is reused while each envelope keeps its own id."""
+        first = handle_mcp_request({'jsonrpc': '2.0', 'method': 'initialize', 'id': 1})
+        second = handle_mcp_request({'jsonrpc': '2.0', 'method': 'initialize', 'id': 'b'})
+
+        assert first['result'] is second['result']
+        assert first is not second
+        assert (first['id'], second['id']) == (1, 'b')
+
 
 class TestMCPToolsList:
     """Tests for MCP tools/list method."""
@@ -125,6 +134,12 @@ class TestMCPToolsList:
         for expected_tool in expected_tools:
             assert expected_tool in tool_names
 
+    def test_every_listed_tool_is_dispatched(self):
+        """Test the tools/call dispatch table covers exactly the listed tools."""
+        from index import TOOL_DEFINITIONS, TOOL_HANDLERS
+
+        assert set(TOOL_HANDLERS) == {tool['name'] for tool in TOOL_DEFINITIONS}
+
     def test_tool_schema_structure(self):
         """Test that each tool has required schema fields."""
         request = {
@@ -337,6 +352,28 @@ class TestMCPErrorHandling:
         assert response['error']['code'] == ERROR_CODES['INVALID_PARAMETER']
         assert 'Unknown tool' in response['error']['message']
 
+    def test_unhashable_tool_name(self):
+        """Test a non-string tool name is reported as unknown rather than raising."""
+        request = {
+            'jsonrpc': '2.0',
+            'method': 'tools/call',
+            'params': {'name': ['get_stride_threat_framework'], 'arguments': {}},
+            'id': 102
+        }
+        response = handle_mcp_request(request)
+
+        assert response['error']['code'] == ERROR_CODES['INVALID_PARAMETER']
+        assert 'Unknown tool' in response['error']['message']
+
+    def test_non_object_params(self):
+        """Test tools/call params that are not an object are rejected as invalid params."""
+        for params in (None, [1], 'get_stride_threat_framework'):
+            request = {'jsonrpc': '2.0', 'method': 'tools/call', 'params': params, 'id': 103}
+            response = handle_mcp_request(request)
+
+            assert response['error']['code'] == -32602
+            assert response['id'] == 103
+
     def test_tool_execution_error(self):
         """Test handling of tool execution error."""
         # This test deliberately causes an error by passing invalid arguments
@@ -356,6 +393,93 @@ class TestMCPErrorHandling:
         assert response['error']['code'] == ERROR_CODES['TOOL_EXECUTION_FAILED']
 
 
+class TestToolResultCache:
+    """Tests for memoized tool output on tools/call."""
+
+    def call(self, name, arguments, request_id=1):
+        return handle_mcp_request({
+            'jsonrpc': '2.0',
+            'method': 'tools/call',
+            'params': {'name': name, 'arguments': arguments},
+            'id': request_id
+        })
+
+    def test_repeat_call_hits_cache(self):
+        """Test identical arguments are served from the cache."""
+        from index import cached_tool_json
+        cached_tool_json.cache_clear()
+
+        first = self.call('get_stride_threat_framework', {'app_description': 'Cache test', 'internet_facing': False}, 1)
+        second = self.call('get_stride_threat_framework', {'internet_facing': False, 'app_description': 'Cache test'}, 2)
+
+        assert cached_tool_json.cache_info().hits == 1
+        assert first['result']['content'][0]['text'] == second['result']['content'][0]['text']
+        assert second['id'] == 2
+
+    def test_different_arguments_not_shared(self):
+        """Test distinct arguments produce distinct cached results."""
+        first = self.call('get_repository_analysis_guide', {'analysis_stage': 'initial'})
+        second = self.call('get_repository_analysis_guide', {'analysis_stage': 'validation'})
+
+        assert json.loads(first['result']['content'][0]['text'])['current_stage'] == 'initial'
+        assert json.loads(second['result']['content'][0]['text'])['current_stage'] == 'validation'
+
+    def test_cached_result_isolated_from_request(self):
+        """Test mutating request arguments after a call does not alter cached output."""
+        arguments = {'app_description': 'Isolation test', 'authentication_methods': ['OAuth']}
+        self.call('get_stride_threat_framework', arguments)
+        arguments['authentication_methods'].append('SAML')
+
+        response = self.call('get_stride_threat_framework', {'app_description': 'Isolation test', 'authentication_methods': ['OAuth']})
+        context = json.loads(response['result']['content'][0]['text'])['application_context']
+        assert context['authentication_methods'] == ['OAuth']
+
+    def test_argument_key_order_preserved(self):
+        """Test echoed arguments keep the caller's key order, cached or oversized."""
+        from index import MAX_CACHED_ARGUMENTS_SIZE
+        small = {'zeta': 1, 'alpha': 2, 'mid': {'y': 1, 'b': 2}}
+        large = {'zeta': 1, 'alpha': 2, 'notes': 'x' * MAX_CACHED_ARGUMENTS_SIZE}
+
+        for context in (small, large):
+            response = self.call('get_repository_analysis_guide', {'repository_context': context})
+            text = response['result']['content'][0]['text']
+            echoed = json.loads(text)['repository_context']
+
+            assert list(echoed) == list(context)
+            if 'mid' in context:
+                assert list(echoed['mid']) == ['y', 'b']
+
+    def test_tool_text_is_compact_json(self):
+        """Test tool results are serialized without indentation."""
+        response = self.call('get_repository_analysis_guide', {'analysis_stage': 'validation'})
+        text = response['result']['content'][0]['text']
+
+        assert '\n' not in text
+        assert json.loads(text)['current_stage'] == 'validation'
+
+    def test_report_cached_as_markdown(self):
+        """Test the Markdown report is cached and returned as plain text."""
+        arguments = {'threat_model': [{'id': 'T1'}, {'id': 'T2'}]}
+        first = self.call('generate_threat_report', arguments)
+        second = self.call('generate_threat_report', arguments)
+
+        text = first['result']['content'][0]['text']
+        assert text.startswith('# STRIDE Threat Model Report')
+        assert '**Total Threats Identified:** 2' in text
+        assert second['result']['content'][0]['text'] == text
+
+    def test_large_arguments_bypass_cache(self):
+        """Test oversized arguments are served without populating the cache."""
+        from index import cached_tool_json, MAX_CACHED_ARGUMENTS_SIZE
+        cached_tool_json.cache_clear()
+
+        threats = [{'id': f'T{i}', 'description': 'x' * 100} for i in range(MAX_CACHED_ARGUMENTS_SIZE // 100)]
+        response = self.call('generate_threat_mitigations', {'threats': threats})
+
+        assert cached_tool_json.cache_info().currsize == 0
+        assert len(json.loads(response['result']['content'][0]['text'])['threat_context']) == len(threats)
+
+
 class TestMCPRequestIDHandling:
     """Tests for proper request ID handling."""
 
@@ -590,3 +590,47 @@ class TestGetRepositoryAnalysisGuide:
         result_empty = get_repository_analysis_guide({})
         assert 'repository_context' in result_empty
         assert result_empty['repository_context'] == {}
+
+
+class TestStaticFrameworkSharing:
+    """Tests that static framework content is built once and shared."""
+
+    def test_framework_shared_across_calls(self):
+        """Test repeated calls reuse the same framework objects."""
+        first = calculate_threat_risk_scores({'threats': [{'id': 'T1'}]})
+        second = calculate_threat_risk_scores({'threats': [{'id': 'T2'}]})
+
+        assert first['dread_framework'] is second['dread_framework']
+        assert first['scoring_examples'] is second['scoring_examples']
+
+    def test_per_call_context_not_shared(self):
+        """Test per-call fields are still built from each call's arguments."""
+        first = get_stride_threat_framework({'app_description': 'First app'})
+        second = get_stride_threat_framework({'app_description': 'Second app'})
+
+        assert first['stride_framework'] is second['stride_framework']
+        assert first['application_context'] is not second['application_context']
+        assert first['application_context']['app_description'] == 'First app'
+        assert second['application_context']['app_description'] == 'Second app'
+
+    def test_default_lists_not_shared(self):
+        """Test mutating a returned default list does not leak into later calls."""
+        first = get_stride_threat_framework({'app_description': 'First app'})
+        first['application_context']['authentication_methods'].append('Injected')
+        first['application_context']['sensitive_data_types'].clear()
+
+        second = get_stride_threat_framework({'app_description': 'Second app'})
+        assert second['application_context']['authentication_methods'] == ['Username/Password']
+        assert second['application_context']['sensitive_data_types'] == ['User Data']
+
+    def test_repository_guide_stage_sections_shared(self):
+        """Test repository guide stages reuse static sections without leaking keys."""
+        first = get_repository_analysis_guide({'analysis_stage': 'deep_dive'})
+        second = get_repository_analysis_guide({'analysis_stage': 'deep_dive'})
+        validation = get_repository_analysis_guide({'analysis_stage': 'validation'})
+
+        assert first is not second
+        assert first['deep_dive_analysis'] is second['deep_dive_analysis']
+        assert first['output_template'] is validation['output_template']
+        assert 'deep_dive_analysis' not in validation
+        assert 'technology_guides' not in validation